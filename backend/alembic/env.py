@@ -1,6 +1,6 @@
 """Alembic environment configuration."""
 from logging.config import fileConfig
-from sqlalchemy import pool, create_engine
+from sqlalchemy import create_engine
 from sqlalchemy.engine import Connection
 from alembic import context
 
@@ -16,11 +16,9 @@ from app.models import *  # noqa: F401, F403 - Import all models
 # this is the Alembic Config object
 config = context.config
 
-# Get database URL from settings and convert asyncpg to psycopg2 for Alembic
+# Get database URL from settings; Alembic runs synchronously on psycopg 3
 settings = get_settings()
-db_url = settings.database_url_sync
-# Replace asyncpg with psycopg2 for synchronous Alembic execution
-db_url_sync = db_url.replace("postgresql+asyncpg://", "postgresql://")
+db_url_sync = settings.database_url_sync
 config.set_main_option("sqlalchemy.url", db_url_sync)
 
 # Interpret the config file for Python logging
@@ -62,6 +60,12 @@ def run_migrations_offline() -> None:
 
 def do_run_migrations(connection: Connection) -> None:
     """Run migrations with connection."""
+    # Pending revisions share the transaction opened here, except that
+    # revisions building indexes CONCURRENTLY commit it early through
+    # autocommit_block(). Each revision sends its DDL as a single
+    # multi-statement script, so scripts must not carry their own
+    # BEGIN/COMMIT: that would end this transaction early and leave
+    # alembic_version out of step with the schema on failure.
     context.configure(connection=connection, target_metadata=target_metadata)
 
     with context.begin_transaction():
@@ -75,10 +79,14 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
-    # Use synchronous engine for Alembic
+    # Use synchronous engine for Alembic. Migrations run serially, so a single
+    # pooled connection is reused for every DDL statement instead of paying a
+    # fresh connect/auth handshake per checkout.
     connectable = create_engine(
         config.get_main_option("sqlalchemy.url"),
-        poolclass=pool.NullPool,
+        pool_size=1,
+        max_overflow=0,
+        pool_pre_ping=False,
     )
 
     with connectable.connect() as connection:
@@ -1,7 +1,7 @@
 """Add github_token column to users table.
 
 Revision ID: 002
-Revises: 001
+Revises: 001_initial
 Create Date: 2025-12-02 12:00:00.000000
 
 """
@@ -11,7 +11,7 @@ import sqlalchemy as sa
 
 # revision identifiers, used by Alembic.
 revision = '002'
-down_revision = '001'
+down_revision = '001_initial'
 branch_labels = None
 depends_on = None
 
@@ -0,0 +1,70 @@
+"""Convert checklist_items.required to boolean and status columns to enums.
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+UPGRADE_SQL = """
+CREATE TYPE issue_status AS ENUM ('pending', 'processed', 'needs_attention');
+CREATE TYPE pr_validation_status AS ENUM ('pending', 'validated', 'needs_work');
+CREATE TYPE test_result_status AS ENUM ('passed', 'failed', 'skipped');
+
+ALTER TABLE checklist_items
+    ALTER COLUMN required DROP DEFAULT,
+    ALTER COLUMN required TYPE boolean USING required::boolean,
+    ALTER COLUMN required SET DEFAULT false;
+
+ALTER TABLE issues
+    ALTER COLUMN status DROP DEFAULT,
+    ALTER COLUMN status TYPE issue_status USING status::issue_status,
+    ALTER COLUMN status SET DEFAULT 'pending';
+
+ALTER TABLE pull_requests
+    ALTER COLUMN validation_status DROP DEFAULT,
+    ALTER COLUMN validation_status TYPE pr_validation_status USING validation_status::pr_validation_status,
+    ALTER COLUMN validation_status SET DEFAULT 'pending';
+
+ALTER TABLE test_results
+    ALTER COLUMN status TYPE test_result_status USING status::test_result_status;
+"""
+
+DOWNGRADE_SQL = """
+ALTER TABLE checklist_items
+    ALTER COLUMN required DROP DEFAULT,
+    ALTER COLUMN required TYPE varchar(50) USING required::text,
+    ALTER COLUMN required SET DEFAULT 'false';
+
+ALTER TABLE issues
+    ALTER COLUMN status DROP DEFAULT,
+    ALTER COLUMN status TYPE varchar(50) USING status::text,
+    ALTER COLUMN status SET DEFAULT 'pending';
+
+ALTER TABLE pull_requests
+    ALTER COLUMN validation_status DROP DEFAULT,
+    ALTER COLUMN validation_status TYPE varchar(50) USING validation_status::text,
+    ALTER COLUMN validation_status SET DEFAULT 'pending';
+
+ALTER TABLE test_results
+    ALTER COLUMN status TYPE varchar(50) USING status::text;
+
+DROP TYPE issue_status, pr_validation_status, test_result_status;
+"""
+
+
+def upgrade() -> None:
+    op.execute(UPGRADE_SQL)
+
+
+def downgrade() -> None:
+    op.execute(DOWNGRADE_SQL)
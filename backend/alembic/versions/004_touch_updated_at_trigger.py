@@ -0,0 +1,57 @@
+"""Maintain updated_at with a BEFORE UPDATE trigger.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+TOUCHED_TABLES = (
+    'organizations',
+    'users',
+    'repos',
+    'user_repo_roles',
+    'issues',
+    'checklist_items',
+    'pull_requests',
+    'test_results',
+    'code_health',
+    'reports',
+    'notifications',
+    'audit_logs',
+)
+
+TOUCH_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION _touch_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at = CURRENT_TIMESTAMP;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+""".strip()
+
+
+def upgrade() -> None:
+    statements = [TOUCH_FUNCTION_SQL]
+    for table in TOUCHED_TABLES:
+        statements.append(f"DROP TRIGGER IF EXISTS trg_touch_{table} ON {table}")
+        statements.append(
+            f"CREATE TRIGGER trg_touch_{table} BEFORE UPDATE ON {table} "
+            "FOR EACH ROW EXECUTE FUNCTION _touch_updated_at()"
+        )
+    op.execute(";\n".join(statements) + ";")
+
+
+def downgrade() -> None:
+    statements = [f"DROP TRIGGER IF EXISTS trg_touch_{table} ON {table}" for table in TOUCHED_TABLES]
+    statements.append("DROP FUNCTION IF EXISTS _touch_updated_at()")
+    op.execute(";\n".join(statements) + ";")
@@ -0,0 +1,58 @@
+"""Add covering composite indexes for list queries and drop redundant ones.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+# Issue and PR lists filter by repo and order by newest first, reading only
+# the status; notification lists filter by user and read flag, newest first.
+# Each composite serves its query's filter and ordering without a sort.
+COMPOSITE_INDEXES = {
+    'ix_issues_repo_created':
+        'ON issues (repo_id, created_at DESC) INCLUDE (status)',
+    'ix_pull_requests_repo_created':
+        'ON pull_requests (repo_id, created_at DESC) INCLUDE (validation_status)',
+    'ix_notifications_user_read_created':
+        'ON notifications (user_id, read, created_at DESC)',
+}
+
+# The single-column indexes are covered by the composites above (repo_id,
+# user_id), or too unselective to be chosen (read, target_type).
+REDUNDANT_INDEXES = {
+    'ix_issues_repo_id': 'ON issues (repo_id)',
+    'ix_pull_requests_repo_id': 'ON pull_requests (repo_id)',
+    'ix_notifications_user_id': 'ON notifications (user_id)',
+    'ix_notifications_read': 'ON notifications (read)',
+    'ix_audit_logs_target_type': 'ON audit_logs (target_type)',
+}
+
+
+def _swap_indexes(create: dict, drop: dict) -> None:
+    # Populated tables are indexed without blocking writes
+    with op.get_context().autocommit_block():
+        for name, definition in create.items():
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} {definition}")
+        for name in drop:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def upgrade() -> None:
+    # code_health carried both a UNIQUE constraint and a unique index on pr_id
+    op.execute("ALTER TABLE code_health DROP CONSTRAINT IF EXISTS code_health_pr_id_key")
+    _swap_indexes(COMPOSITE_INDEXES, REDUNDANT_INDEXES)
+
+
+def downgrade() -> None:
+    _swap_indexes(REDUNDANT_INDEXES, COMPOSITE_INDEXES)
+    op.execute("ALTER TABLE code_health ADD CONSTRAINT code_health_pr_id_key UNIQUE (pr_id)")
@@ -0,0 +1,37 @@
+"""Leave free space on in-place-updated tables for HOT updates.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+# issues, checklist_items, pull_requests and reports are updated in place
+# (status changes, regenerated checklists/manifests/reports), so their heap
+# pages keep 20% free space for HOT updates. Large text/JSONB columns keep the
+# default EXTENDED storage: compressed and out-of-line, which is already what
+# we want for payloads that are read whole on detail pages only. The setting
+# only applies to pages written from now on; existing pages pick it up as
+# they are rewritten.
+FILLFACTOR_TABLES = ('issues', 'checklist_items', 'pull_requests', 'reports')
+
+
+def upgrade() -> None:
+    op.execute(";\n".join(
+        f"ALTER TABLE {table} SET (fillfactor = 80)" for table in FILLFACTOR_TABLES
+    ) + ";")
+
+
+def downgrade() -> None:
+    op.execute(";\n".join(
+        f"ALTER TABLE {table} RESET (fillfactor)" for table in FILLFACTOR_TABLES
+    ) + ";")
@@ -0,0 +1,56 @@
+"""Cover the user/role lookups on user_repo_roles with one composite index.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+# Managed-repo and access queries filter user_repo_roles by (user_id, role)
+# and join on repo_id; with repo_id included they never touch the heap. The
+# index leads with user_id, which makes ix_user_repo_roles_user_id redundant.
+# repos.installation_id is already covered by ix_repos_installation_id.
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_user_repo_roles_user_role',
+            'user_repo_roles',
+            ['user_id', 'role'],
+            postgresql_include=['repo_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_user_repo_roles_user_id',
+            table_name='user_repo_roles',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_user_repo_roles_user_id',
+            'user_repo_roles',
+            ['user_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_user_repo_roles_user_role',
+            table_name='user_repo_roles',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
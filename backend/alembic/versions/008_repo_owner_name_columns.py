@@ -0,0 +1,34 @@
+"""Store each repo's owner and name as generated columns.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+# Postgres computes both on every write of repo_full_name, so no application
+# code has to keep them in sync. Adding a stored column rewrites repos, which
+# is a small table.
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE repos"
+        " ADD COLUMN owner VARCHAR(512)"
+        " GENERATED ALWAYS AS (split_part(repo_full_name, '/', 1)) STORED,"
+        " ADD COLUMN name VARCHAR(512)"
+        " GENERATED ALWAYS AS (substr(repo_full_name, strpos(repo_full_name, '/') + 1)) STORED"
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE repos DROP COLUMN owner, DROP COLUMN name")
@@ -0,0 +1,64 @@
+"""Index issues and pull requests by (repo_id, number).
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-16 19:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+# Every issue/PR lookup filters on repo_id and the GitHub number together,
+# which a unique composite index answers with a single point lookup. It
+# also enforces what the get-or-create paths assume: one row per number per
+# repo. Nothing filters on the number alone, so the single-column indexes
+# are dropped. Duplicate (repo_id, number) rows must be merged beforehand,
+# or the unique build fails (leaving an INVALID index to drop and retry).
+INDEXES = (
+    ('issues', 'ix_issues_repo_number', 'issue_number', 'ix_issues_issue_number'),
+    ('pull_requests', 'ix_pull_requests_repo_number', 'pr_number', 'ix_pull_requests_pr_number'),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, name, number_column, old_name in INDEXES:
+            op.create_index(
+                name,
+                table,
+                ['repo_id', number_column],
+                unique=True,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            op.drop_index(
+                old_name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, name, number_column, old_name in INDEXES:
+            op.create_index(
+                old_name,
+                table,
+                [number_column],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,83 @@
+"""Keep per-repo PR and issue counts on repos, maintained by triggers.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-16 20:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+# (counted table, counter column on repos). Rows never move between repos,
+# so only INSERT and DELETE adjust the counters. Creating the triggers locks
+# out concurrent writes to the counted tables until this migration commits,
+# so the backfill below cannot miss or double-count a row.
+COUNTERS = (
+    ('pull_requests', 'pr_count'),
+    ('issues', 'issue_count'),
+)
+
+# A counter bump is not a change to the repo itself, so trg_touch_repos from
+# 004 is narrowed to updates of the repo's own columns; otherwise every new
+# PR or issue would move repos.updated_at.
+TOUCH_COLUMNS = ('repo_full_name', 'installation_id', 'is_installed', 'owner_org_id')
+
+COUNT_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION _count_{table}() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE repos SET {column} = {column} + 1 WHERE id = NEW.repo_id;
+    ELSE
+        UPDATE repos SET {column} = {column} - 1 WHERE id = OLD.repo_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""".strip()
+
+
+def upgrade() -> None:
+    statements = [
+        "ALTER TABLE repos"
+        " ADD COLUMN IF NOT EXISTS pr_count INTEGER NOT NULL DEFAULT 0,"
+        " ADD COLUMN IF NOT EXISTS issue_count INTEGER NOT NULL DEFAULT 0"
+    ]
+    for table, column in COUNTERS:
+        statements.append(COUNT_FUNCTION_SQL.format(table=table, column=column))
+        statements.append(f"DROP TRIGGER IF EXISTS trg_count_{table} ON {table}")
+        statements.append(
+            f"CREATE TRIGGER trg_count_{table} AFTER INSERT OR DELETE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION _count_{table}()"
+        )
+    statements.append("DROP TRIGGER IF EXISTS trg_touch_repos ON repos")
+    statements.append(
+        f"CREATE TRIGGER trg_touch_repos BEFORE UPDATE OF {', '.join(TOUCH_COLUMNS)} ON repos "
+        "FOR EACH ROW EXECUTE FUNCTION _touch_updated_at()"
+    )
+    statements.append(
+        "UPDATE repos SET"
+        " pr_count = (SELECT count(*) FROM pull_requests WHERE pull_requests.repo_id = repos.id),"
+        " issue_count = (SELECT count(*) FROM issues WHERE issues.repo_id = repos.id)"
+    )
+    op.execute(";\n".join(statements) + ";")
+
+
+def downgrade() -> None:
+    statements = []
+    for table, _ in COUNTERS:
+        statements.append(f"DROP TRIGGER IF EXISTS trg_count_{table} ON {table}")
+        statements.append(f"DROP FUNCTION IF EXISTS _count_{table}()")
+    statements.append("ALTER TABLE repos DROP COLUMN IF EXISTS pr_count, DROP COLUMN IF EXISTS issue_count")
+    statements.append("DROP TRIGGER IF EXISTS trg_touch_repos ON repos")
+    statements.append(
+        "CREATE TRIGGER trg_touch_repos BEFORE UPDATE ON repos "
+        "FOR EACH ROW EXECUTE FUNCTION _touch_updated_at()"
+    )
+    op.execute(";\n".join(statements) + ";")
@@ -0,0 +1,47 @@
+"""Replace single-column test result and audit log indexes with composites.
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-16 21:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+# Test results are read per PR and matched by test_id; nothing filters on
+# test_id alone. Audit entries are looked up per target, and target_id is
+# only unique within a target_type. Each composite leads with the column the
+# replaced indexes served, so the old ones are dropped.
+COMPOSITE_INDEXES = {
+    'ix_test_results_pr_test': 'ON test_results (pr_id, test_id) INCLUDE (status)',
+    'ix_audit_logs_target': 'ON audit_logs (target_type, target_id)',
+}
+
+REPLACED_INDEXES = {
+    'ix_test_results_pr_id': 'ON test_results (pr_id)',
+    'ix_test_results_test_id': 'ON test_results (test_id)',
+    'ix_audit_logs_target_id': 'ON audit_logs (target_id)',
+}
+
+
+def _swap_indexes(create: dict, drop: dict) -> None:
+    with op.get_context().autocommit_block():
+        for name, definition in create.items():
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} {definition}")
+        for name in drop:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def upgrade() -> None:
+    _swap_indexes(COMPOSITE_INDEXES, REPLACED_INDEXES)
+
+
+def downgrade() -> None:
+    _swap_indexes(REPLACED_INDEXES, COMPOSITE_INDEXES)
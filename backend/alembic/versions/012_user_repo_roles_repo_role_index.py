@@ -0,0 +1,55 @@
+"""Cover the repo/role lookups on user_repo_roles with one composite index.
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-16 22:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+
+# Manager notification fan-out selects user_id from user_repo_roles by
+# (repo_id, role); with user_id included it is an index-only scan. The
+# index leads with repo_id, which makes ix_user_repo_roles_repo_id redundant.
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_user_repo_roles_repo_role',
+            'user_repo_roles',
+            ['repo_id', 'role'],
+            postgresql_include=['user_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_user_repo_roles_repo_id',
+            table_name='user_repo_roles',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_user_repo_roles_repo_id',
+            'user_repo_roles',
+            ['repo_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_user_repo_roles_repo_role',
+            table_name='user_repo_roles',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
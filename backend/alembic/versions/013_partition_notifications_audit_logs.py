@@ -0,0 +1,157 @@
+"""Partition notifications and audit_logs by month on created_at.
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+
+# notifications and audit_logs are append-only and read by recent time window,
+# so they are range-partitioned by month on created_at. Indexes declared on the
+# parent are created on every partition as local indexes. Old months can be
+# retired with DETACH PARTITION / DROP TABLE instead of a bulk DELETE.
+# create_monthly_partitions() is idempotent; the migration provisions the
+# current month plus PARTITION_MONTHS_AHEAD, and the daily ensure_partitions
+# worker task calls it so the window rolls forward. The DEFAULT partition
+# catches older rows copied over from the unpartitioned table, and rows that
+# would otherwise fail to insert if the job falls behind; the helper moves the
+# latter into their month's partition when it is created, since
+# CREATE ... PARTITION OF fails while DEFAULT holds rows in its range.
+#
+# A table cannot be converted in place, so each one is rebuilt: renamed, its
+# rows copied into a new partitioned table of the same shape, then dropped.
+# The primary key must include the partition key, hence (id, created_at). The
+# id sequence is handed over to the new table before the old one is dropped,
+# and the updated_at trigger from 004 is recreated on it. Writes to both
+# tables wait until the migration commits.
+PARTITIONED_TABLES = ('notifications', 'audit_logs')
+PARTITION_MONTHS_AHEAD = 12
+
+FOREIGN_KEYS = {
+    'notifications': (
+        'FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE',
+        'FOREIGN KEY (repo_id) REFERENCES repos (id) ON DELETE CASCADE',
+    ),
+    'audit_logs': (
+        'FOREIGN KEY (actor_user_id) REFERENCES users (id) ON DELETE SET NULL',
+    ),
+}
+
+INDEXES = {
+    'notifications': {
+        'ix_notifications_user_read_created': '(user_id, read, created_at DESC)',
+        'ix_notifications_repo_id': '(repo_id)',
+    },
+    'audit_logs': {
+        'ix_audit_logs_actor_user_id': '(actor_user_id)',
+        'ix_audit_logs_action': '(action)',
+        'ix_audit_logs_target': '(target_type, target_id)',
+    },
+}
+
+PARTITION_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION create_monthly_partitions(parent text, months_ahead integer)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    default_part text := parent || '_default';
+    month_start date;
+    month_end date;
+    part text;
+    has_rows boolean;
+    moved bigint;
+BEGIN
+    FOR i IN 0..months_ahead LOOP
+        month_start := (date_trunc('month', now()) + make_interval(months => i))::date;
+        month_end := (month_start + interval '1 month')::date;
+        part := parent || '_' || to_char(month_start, 'YYYY_MM');
+        CONTINUE WHEN to_regclass(part) IS NOT NULL;
+
+        has_rows := false;
+        IF to_regclass(default_part) IS NOT NULL THEN
+            EXECUTE format('LOCK TABLE %I IN ACCESS EXCLUSIVE MODE', default_part);
+            EXECUTE format(
+                'SELECT EXISTS (SELECT 1 FROM %I WHERE created_at >= %L AND created_at < %L)',
+                default_part, month_start, month_end
+            ) INTO has_rows;
+        END IF;
+
+        IF has_rows THEN
+            EXECUTE format('CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS)', part, parent);
+            EXECUTE format(
+                'WITH moved AS (DELETE FROM %I WHERE created_at >= %L AND created_at < %L RETURNING *) '
+                'INSERT INTO %I SELECT * FROM moved',
+                default_part, month_start, month_end, part
+            );
+            GET DIAGNOSTICS moved = ROW_COUNT;
+            RAISE WARNING 'moved % rows from % into new partition %', moved, default_part, part;
+            EXECUTE format(
+                'ALTER TABLE %I ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                parent, part, month_start, month_end
+            );
+        ELSE
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+                part, parent, month_start, month_end
+            );
+        END IF;
+    END LOOP;
+END;
+$$
+""".strip()
+
+
+def _rebuild_sql(table: str, partitioned: bool) -> list:
+    """Statements that rebuild ``table`` as a partitioned (or plain) table."""
+    old = f"{table}_old"
+    partition_by = " PARTITION BY RANGE (created_at)" if partitioned else ""
+    primary_key = "id, created_at" if partitioned else "id"
+    statements = [
+        f"ALTER TABLE {table} RENAME TO {old}",
+        f"CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS INCLUDING STORAGE){partition_by}",
+        f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id",
+    ]
+    if partitioned:
+        statements += [
+            f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT",
+            f"SELECT create_monthly_partitions('{table}', {PARTITION_MONTHS_AHEAD})",
+        ]
+    statements += [
+        f"INSERT INTO {table} SELECT * FROM {old}",
+        f"DROP TABLE {old}",
+        f"ALTER TABLE {table} ADD PRIMARY KEY ({primary_key})",
+    ]
+    statements += [f"ALTER TABLE {table} ADD {fk}" for fk in FOREIGN_KEYS[table]]
+    statements += [
+        f"CREATE INDEX {name} ON {table} {columns}" for name, columns in INDEXES[table].items()
+    ]
+    statements.append(
+        f"CREATE TRIGGER trg_touch_{table} BEFORE UPDATE ON {table} "
+        "FOR EACH ROW EXECUTE FUNCTION _touch_updated_at()"
+    )
+    return statements
+
+
+def upgrade() -> None:
+    statements = [PARTITION_FUNCTION_SQL]
+    for table in PARTITIONED_TABLES:
+        statements += _rebuild_sql(table, partitioned=True)
+    op.execute(";\n".join(statements) + ";")
+
+
+def downgrade() -> None:
+    statements = []
+    for table in PARTITIONED_TABLES:
+        statements += _rebuild_sql(table, partitioned=False)
+    statements.append("DROP FUNCTION IF EXISTS create_monthly_partitions(text, integer)")
+    op.execute(";\n".join(statements) + ";")
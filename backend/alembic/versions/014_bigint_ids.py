@@ -0,0 +1,55 @@
+"""Widen ids on high-volume tables to BIGINT.
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '014'
+down_revision = '013'
+branch_labels = None
+depends_on = None
+
+
+# checklist_items and test_results gain rows on every issue/PR event, and
+# notifications and audit_logs on every action, so their SERIAL ids are the
+# ones that can run out of 32-bit range. audit_logs.target_id points at those
+# ids too. Changing a column type rewrites the table (every partition, for
+# the partitioned ones) under an exclusive lock; the sequences only need their
+# type, and with it their maximum, raised.
+COLUMNS = (
+    ('checklist_items', 'id'),
+    ('test_results', 'id'),
+    ('notifications', 'id'),
+    ('audit_logs', 'id'),
+    ('audit_logs', 'target_id'),
+)
+
+SEQUENCES = (
+    'checklist_items_id_seq',
+    'test_results_id_seq',
+    'notifications_id_seq',
+    'audit_logs_id_seq',
+)
+
+
+def _alter_sql(column_type: str) -> str:
+    statements = [
+        f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {column_type}"
+        for table, column in COLUMNS
+    ]
+    statements += [f"ALTER SEQUENCE {sequence} AS {column_type}" for sequence in SEQUENCES]
+    return ";\n".join(statements) + ";"
+
+
+def upgrade() -> None:
+    op.execute(_alter_sql("bigint"))
+
+
+def downgrade() -> None:
+    # Fails once any id has outgrown integer; such data cannot be narrowed
+    op.execute(_alter_sql("integer"))
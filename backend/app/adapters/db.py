@@ -1,7 +1,13 @@
 """Database adapter with async SQLAlchemy."""
-from typing import AsyncGenerator
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.pool import NullPool
+import asyncio
+from contextlib import asynccontextmanager
+from functools import cache
+from typing import Any, AsyncGenerator, AsyncIterator
+import orjson
+from fastapi import Request
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 from app.config import get_settings
 from app.models.base import Base
 from app.logging_config import get_logger
@@ -9,68 +15,136 @@ from app.logging_config import get_logger
 logger = get_logger(__name__)
 settings = get_settings()
 
-# Global engine and session factory
-engine = None
-async_session_maker = None
+# Requests with these methods only read, so their session runs in autocommit
+# mode: no BEGIN/COMMIT round trips, and nothing to roll back when the
+# connection goes back to the pool.
+_READ_ONLY_METHODS = frozenset({"GET", "HEAD"})
+
+
+def json_dumps(obj: Any) -> str:
+    """JSON(B) column serializer; non-str keys are stringified like json.dumps."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+@cache
+def _engine() -> AsyncEngine:
+    """Build the process-wide async engine on first use."""
+    # NullPool rejects pool sizing arguments, so only pass them to the
+    # queue pool. Connections are recycled before PgBouncer's idle
+    # timeout instead of being pinged on every checkout, and JIT is
+    # disabled since our short OLTP queries never amortize its cost.
+    if settings.DEBUG:
+        pool_kwargs = {"poolclass": NullPool}
+    else:
+        pool_kwargs = {
+            "poolclass": AsyncAdaptedQueuePool,
+            "pool_size": settings.DATABASE_POOL_SIZE,
+            "max_overflow": 5,
+            "pool_recycle": 60,
+        }
+
+    engine = create_async_engine(
+        settings.database_url_async,
+        echo=settings.DEBUG,
+        pool_pre_ping=False,
+        connect_args={"server_settings": {"jit": "off"}},
+        json_serializer=json_dumps,
+        json_deserializer=orjson.loads,
+        **pool_kwargs,
+    )
+    logger.info("Database connection pool initialized")
+    return engine
+
+
+@cache
+def _session_factory() -> async_sessionmaker:
+    """Session factory for transactional (read-write) sessions."""
+    return async_sessionmaker(
+        _engine(),
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+
+
+@cache
+def _read_session_factory() -> async_sessionmaker:
+    """Session factory for autocommit sessions used by read-only requests."""
+    return async_sessionmaker(
+        _engine().execution_options(isolation_level="AUTOCOMMIT"),
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autoflush=False,
+    )
 
 
 async def init_db() -> None:
     """Initialize database connection pool."""
-    global engine, async_session_maker
-    
-    if engine is None:
-        # Normalize DATABASE_URL: strip surrounding quotes if present (handles
-        # values like '"postgresql+asyncpg://..."' from .env files).
-        db_url = settings.DATABASE_URL
-        if isinstance(db_url, str):
-            db_url = db_url.strip('\"\'')
-
-        engine = create_async_engine(
-            db_url,
-            echo=settings.DEBUG,
-            poolclass=NullPool if settings.DEBUG else None,
-            pool_pre_ping=True,
-            pool_size=10,
-            max_overflow=20,
-        )
-        async_session_maker = async_sessionmaker(
-            engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
-            autocommit=False,
-            autoflush=False,
-        )
-        logger.info("Database connection pool initialized")
+    _engine()
+    if settings.DATABASE_POOL_WARMUP and not settings.DEBUG:
+        await _warm_pool(settings.DATABASE_POOL_SIZE)
+
+
+async def _warm_pool(size: int) -> None:
+    """Open `size` pooled connections up front so early requests skip connect."""
+    async def _checkout() -> None:
+        async with _engine().connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    try:
+        await asyncio.gather(*(_checkout() for _ in range(size)))
+        logger.info(f"Database connection pool warmed with {size} connections")
+    except Exception as e:
+        logger.warning(f"Database pool warm-up failed: {e}")
 
 
 async def close_db() -> None:
     """Close database connection pool."""
-    global engine
-    if engine:
-        await engine.dispose()
+    if _engine.cache_info().currsize:
+        await _engine().dispose()
+        _read_session_factory.cache_clear()
+        _session_factory.cache_clear()
+        _engine.cache_clear()
         logger.info("Database connection pool closed")
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency for getting database session."""
-    if async_session_maker is None:
-        from app.adapters.db import init_db
-        await init_db()
-    
-    async with async_session_maker() as session:
+@asynccontextmanager
+async def _transaction() -> AsyncIterator[AsyncSession]:
+    """Transactional session committed on success and rolled back on error."""
+    async with _session_factory()() as session:
         try:
             yield session
             await session.commit()
         except Exception:
             await session.rollback()
             raise
-        finally:
-            await session.close()
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for getting database session.
+
+    GET/HEAD requests get an autocommit session that is never committed;
+    everything else gets a transactional session committed on success.
+    GET handlers that write must depend on get_transactional_db instead.
+    """
+    if request.method in _READ_ONLY_METHODS:
+        async with _read_session_factory()() as session:
+            yield session
+        return
+
+    async with _transaction() as session:
+        yield session
+
+
+async def get_transactional_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for a transactional session regardless of HTTP method."""
+    async with _transaction() as session:
+        yield session
 
 
 async def create_tables() -> None:
     """Create all database tables (for testing or initial setup)."""
-    async with engine.begin() as conn:
+    async with _engine().begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     logger.info("Database tables created")
-
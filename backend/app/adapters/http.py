@@ -0,0 +1,50 @@
+"""Shared outbound HTTP client."""
+import asyncio
+from typing import Optional
+import httpx
+from fastapi import Request
+
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Build the process-wide client used for GitHub API calls.
+
+    Keep-alive (and HTTP/2 multiplexing) lets sequential calls reuse one TLS
+    connection instead of handshaking per request.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=10.0,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    )
+
+
+def shared_http_client() -> httpx.AsyncClient:
+    """Shared client for the running event loop.
+
+    Pooled connections belong to the loop that opened them. The API process
+    runs one loop, while each RQ job runs its own asyncio.run loop and gets
+    its own client (closed by the job via close_http_client).
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        _client = create_http_client()
+        _client_loop = loop
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client."""
+    global _client, _client_loop
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        _client_loop = None
+
+
+def get_http_client(request: Request) -> httpx.AsyncClient:
+    """Dependency returning the client created during app startup."""
+    return request.app.state.http_client
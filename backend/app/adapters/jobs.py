@@ -0,0 +1,47 @@
+"""Background job queue adapter (RQ)."""
+import asyncio
+from functools import cache
+from typing import Any
+import orjson
+import redis
+from rq import Queue
+from rq.job import Job
+from app.config import get_settings
+
+settings = get_settings()
+
+
+class OrjsonSerializer:
+    """RQ serializer storing job data as JSON instead of pickle.
+
+    Task arguments are plain webhook/API dicts and tasks return None, so
+    everything RQ persists is JSON-representable. The worker must be
+    started with the same serializer.
+    """
+
+    @staticmethod
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS)
+
+    @staticmethod
+    def loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+@cache
+def get_queue() -> Queue:
+    """Process-wide default queue on one pooled Redis connection.
+
+    RQ only speaks the synchronous redis client; sharing it means enqueues
+    reuse pooled sockets instead of connecting on every request.
+    """
+    return Queue(
+        "default",
+        connection=redis.from_url(settings.REDIS_URL, max_connections=50),
+        serializer=OrjsonSerializer,
+    )
+
+
+async def enqueue(func: Any, *args: Any, **kwargs: Any) -> Job:
+    """Enqueue a job from async code without blocking the event loop."""
+    return await asyncio.to_thread(get_queue().enqueue, func, *args, **kwargs)
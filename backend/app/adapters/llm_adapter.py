@@ -1,11 +1,13 @@
 """LLM adapter (stubbed for MVP)."""
 from typing import Optional, List, Dict, Any
 from app.config import get_settings
-from app.logging_config import get_logger
 
-logger = get_logger(__name__)
 settings = get_settings()
 
+# Settings are fixed for the life of the process, so resolve the feature flag
+# once instead of on every call.
+_LLM_ENABLED = bool(settings.LLM_PROVIDER and settings.LLM_API_KEY)
+
 
 async def generate_suggested_tests(
     code_diff: str,
@@ -22,8 +24,7 @@ async def generate_suggested_tests(
     Returns:
         List of suggested tests (empty for MVP)
     """
-    if not settings.LLM_PROVIDER or not settings.LLM_API_KEY:
-        logger.debug("LLM integration disabled - returning empty suggestions")
+    if not _LLM_ENABLED:
         return []
     
     # Stub implementation - would call LLM API here
@@ -43,8 +44,7 @@ async def analyze_coverage(
     Returns:
         List of coverage advice (empty for MVP)
     """
-    if not settings.LLM_PROVIDER or not settings.LLM_API_KEY:
-        logger.debug("LLM integration disabled - returning empty coverage advice")
+    if not _LLM_ENABLED:
         return []
     
     # Stub implementation - would call LLM API here
@@ -1,3 +1,7 @@
+"""Optional MongoDB adapter (Motor)."""
+from __future__ import annotations
+
+from functools import lru_cache
 from typing import Optional
 from app.config import get_settings
 
@@ -17,6 +21,18 @@ _client: Optional[AsyncIOMotorClient] = None
 _db: Optional[AsyncIOMotorDatabase] = None
 
 
+@lru_cache(maxsize=1)
+def _database_name(uri: str) -> str:
+    """Determine DB name from URI if present, otherwise default."""
+    dbname = None
+    try:
+        if parse_uri:
+            dbname = parse_uri(uri).get("database")
+    except Exception:
+        dbname = None
+    return dbname or "quantumreview"
+
+
 async def init_mongo() -> None:
     global _client, _db
     uri = settings.MONGODB_URI
@@ -25,20 +41,7 @@ async def init_mongo() -> None:
     if AsyncIOMotorClient is None:
         return
     _client = AsyncIOMotorClient(uri)
-
-    # Determine DB name from URI if present, otherwise default
-    dbname = None
-    try:
-        if parse_uri:
-            parsed = parse_uri(uri)
-            dbname = parsed.get("database")
-    except Exception:
-        dbname = None
-
-    if not dbname:
-        dbname = "quantumreview"
-
-    _db = _client[dbname]
+    _db = _client[_database_name(uri)]
 
 
 async def close_mongo() -> None:
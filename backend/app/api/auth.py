@@ -1,22 +1,100 @@
 """Authentication endpoints."""
-import jwt
-from typing import Optional
-from datetime import datetime, timedelta
+import asyncio
+import base64
+import hashlib
+import hmac
+import time
+from urllib.parse import urlencode
+import orjson
+from cachetools import TTLCache
+from typing import Any, Dict, Optional
 from fastapi import APIRouter, Request, Response, HTTPException, Depends
 from fastapi.responses import RedirectResponse
 import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func, exists
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from app.config import get_settings
-from app.adapters.db import get_db
+from app.adapters.db import get_db, get_transactional_db
+from app.adapters.http import get_http_client
 from app.models.user import User
 from app.models.repo import Repo, UserRepoRole
+from app.services.repo_access import invalidate_managed_repos
 from app.logging_config import get_logger
 
 logger = get_logger(__name__)
 settings = get_settings()
 router = APIRouter()
 
+# Recently verified tokens, keyed by their SHA-256 digest so raw tokens are
+# never held in memory. Only successful verifications are cached, and the
+# short TTL bounds how long a cached entry can outlive anything but expiry.
+_TOKEN_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=10)
+
+# Authenticated users by id. Entries are detached from the session that
+# loaded them; callers only read column attributes, which stay loaded.
+# The OAuth callback evicts the entry whenever it rewrites the row.
+_USER_CACHE: TTLCache = TTLCache(maxsize=5_000, ttl=30)
+
+# GitHub redirects back to the backend callback, which then redirects to the
+# frontend. Settings are fixed for the process, so the URL is built once.
+_BACKEND_URL = (getattr(settings, "BACKEND_ORIGIN", None) or "http://127.0.0.1:8000").rstrip("/")
+_REDIRECT_URI = f"{_BACKEND_URL}/auth/callback"
+_GITHUB_OAUTH_URL = "https://github.com/login/oauth/authorize?" + urlencode({
+    "client_id": settings.GITHUB_OAUTH_CLIENT_ID or "",
+    "redirect_uri": _REDIRECT_URI,
+    "scope": "read:user user:email",
+})
+
+# Session tokens are HS256 JWTs. They are signed and verified in-process
+# with hmac so that the key and the fixed header are encoded once, not on
+# every request. The wire format is unchanged from what PyJWT produced.
+_SIGNING_KEY = settings.JWT_SECRET.encode()
+_JWT_LIFETIME_SECONDS = settings.JWT_EXPIRATION_DAYS * 86400
+
+
+def _b64encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+def _sign(signing_input: bytes) -> bytes:
+    return hmac.new(_SIGNING_KEY, signing_input, hashlib.sha256).digest()
+
+
+_JWT_HEADER = _b64encode(orjson.dumps({"alg": "HS256", "typ": "JWT"}))
+
+# Our tokens are a few hundred bytes; anything far larger is not one of ours.
+_MAX_TOKEN_LENGTH = 4096
+
+
+def _is_well_formed(token: Optional[str]) -> bool:
+    """Cheap structural check so junk cookies never reach hashing or decoding."""
+    return bool(token) and len(token) <= _MAX_TOKEN_LENGTH and token.count(".") == 2
+
+
+def _decode_session_token(token: str) -> Optional[Dict[str, Any]]:
+    """Verify an HS256 token and return its payload, or None if invalid or expired."""
+    try:
+        header, payload, signature = token.encode("ascii").split(b".")
+        if not hmac.compare_digest(_sign(header + b"." + payload), _b64decode(signature)):
+            return None
+        if orjson.loads(_b64decode(header)).get("alg") != "HS256":
+            return None
+        claims = orjson.loads(_b64decode(payload))
+    except (ValueError, AttributeError):
+        return None
+
+    if not isinstance(claims, dict):
+        return None
+    exp = claims.get("exp")
+    if exp is not None and (not isinstance(exp, (int, float)) or exp <= time.time()):
+        return None
+    return claims
+
 
 def create_session_token(user_id: int) -> str:
     """Create JWT session token for user.
@@ -27,14 +105,15 @@ def create_session_token(user_id: int) -> str:
     Returns:
         JWT token string
     """
-    now = datetime.utcnow()
+    now = int(time.time())
     payload = {
         "user_id": user_id,
         "iat": now,
-        "exp": now + timedelta(days=settings.JWT_EXPIRATION_DAYS),
+        "exp": now + _JWT_LIFETIME_SECONDS,
     }
     
-    return jwt.encode(payload, settings.JWT_SECRET, algorithm="HS256")
+    signing_input = _JWT_HEADER + b"." + _b64encode(orjson.dumps(payload))
+    return (signing_input + b"." + _b64encode(_sign(signing_input))).decode("ascii")
 
 
 def get_user_from_token(token: str) -> Optional[int]:
@@ -46,14 +125,26 @@ def get_user_from_token(token: str) -> Optional[int]:
     Returns:
         User ID or None if invalid
     """
-    try:
-        payload = jwt.decode(token, settings.JWT_SECRET, algorithms=["HS256"])
-        return payload.get("user_id")
-    except jwt.ExpiredSignatureError:
+    if not _is_well_formed(token):
         return None
-    except jwt.InvalidTokenError:
+
+    key = hashlib.sha256(token.encode()).digest()
+    cached = _TOKEN_CACHE.get(key)
+    if cached is not None:
+        user_id, exp = cached
+        if exp is None or exp > time.time():
+            return user_id
+        _TOKEN_CACHE.pop(key, None)
+
+    payload = _decode_session_token(token)
+    if payload is None:
         return None
 
+    user_id = payload.get("user_id")
+    if user_id is not None:
+        _TOKEN_CACHE[key] = (user_id, payload.get("exp"))
+    return user_id
+
 
 async def get_current_user(
     request: Request,
@@ -80,39 +171,38 @@ async def get_current_user(
         # Fall back to cookie
         token = request.cookies.get(settings.SESSION_COOKIE_NAME)
     
-    if not token:
+    if not _is_well_formed(token):
         return None
     
     user_id = get_user_from_token(token)
     if not user_id:
         return None
-    
+
+    user = _USER_CACHE.get(user_id)
+    if user is not None:
+        return user
+
     result = await db.execute(select(User).where(User.id == user_id))
-    return result.scalar_one_or_none()
+    user = result.scalar_one_or_none()
+    if user is not None:
+        db.expunge(user)
+        _USER_CACHE[user_id] = user
+    return user
 
 
 @router.get("/github")
 async def github_oauth_start(request: Request):
     """Start GitHub OAuth flow."""
-    # GitHub redirects back to backend callback, then backend redirects to frontend
-    # Use configured backend origin for the OAuth callback
-    backend_url = getattr(settings, "BACKEND_ORIGIN", None) or "http://127.0.0.1:8000"
-    redirect_uri = f"{backend_url.rstrip('/')}/auth/callback"
-    
-    github_oauth_url = (
-        f"https://github.com/login/oauth/authorize"
-        f"?client_id={settings.GITHUB_OAUTH_CLIENT_ID}"
-        f"&redirect_uri={redirect_uri}"
-        f"&scope=read:user user:email"
-    )
-    return RedirectResponse(url=github_oauth_url)
+    return RedirectResponse(url=_GITHUB_OAUTH_URL)
 
 
 @router.get("/callback")
 async def github_oauth_callback(
     request: Request,
     code: Optional[str] = None,
-    db: AsyncSession = Depends(get_db),
+    # A GET that writes: needs a real transaction, not the autocommit session
+    db: AsyncSession = Depends(get_transactional_db),
+    client: httpx.AsyncClient = Depends(get_http_client),
 ):
     """Handle GitHub OAuth callback.
 
@@ -126,96 +216,91 @@ async def github_oauth_callback(
         raise HTTPException(status_code=400, detail="Missing `?code=` from GitHub OAuth callback")
 
     # Exchange code for access token
-    async with httpx.AsyncClient() as client:
-        token_response = await client.post(
-            "https://github.com/login/oauth/access_token",
-            data={
-                "client_id": settings.GITHUB_OAUTH_CLIENT_ID,
-                "client_secret": settings.GITHUB_OAUTH_CLIENT_SECRET,
-                "code": code,
-            },
-            headers={"Accept": "application/json"},
-            timeout=10.0,
-        )
-        token_response.raise_for_status()
-        token_data = token_response.json()
-        access_token = token_data.get("access_token")
-
-        if not access_token:
-            raise HTTPException(status_code=400, detail="Failed to get access token from GitHub")
-
-        # Get user info from GitHub
-        user_response = await client.get(
-            "https://api.github.com/user",
-            headers={"Authorization": f"token {access_token}"},
-            timeout=10.0,
-        )
-        user_response.raise_for_status()
-        github_user = user_response.json()
-
-        # Get user email
-        email_response = await client.get(
-            "https://api.github.com/user/emails",
-            headers={"Authorization": f"token {access_token}"},
-            timeout=10.0,
-        )
-        emails = email_response.json() if email_response.status_code == 200 else []
-        primary_email = next((e["email"] for e in emails if e.get("primary")), None)
+    token_response = await client.post(
+        "https://github.com/login/oauth/access_token",
+        data={
+            "client_id": settings.GITHUB_OAUTH_CLIENT_ID,
+            "client_secret": settings.GITHUB_OAUTH_CLIENT_SECRET,
+            "code": code,
+        },
+        headers={"Accept": "application/json"},
+        timeout=10.0,
+    )
+    token_response.raise_for_status()
+    token_data = token_response.json()
+    access_token = token_data.get("access_token")
+
+    if not access_token:
+        raise HTTPException(status_code=400, detail="Failed to get access token from GitHub")
+
+    # Get user info and emails from GitHub; both only need the access token
+    auth_headers = {"Authorization": f"token {access_token}"}
+    user_response, email_response = await asyncio.gather(
+        client.get("https://api.github.com/user", headers=auth_headers, timeout=10.0),
+        client.get("https://api.github.com/user/emails", headers=auth_headers, timeout=10.0),
+        return_exceptions=True,
+    )
+    if isinstance(user_response, BaseException):
+        raise user_response
+    user_response.raise_for_status()
+    github_user = user_response.json()
+
+    # The email lookup is best-effort
+    if isinstance(email_response, BaseException) or email_response.status_code != 200:
+        emails = []
+    else:
+        emails = email_response.json()
+    primary_email = next((e["email"] for e in emails if e.get("primary")), None)
 
     # Create or update user in database
     github_id = github_user["id"]
     username = github_user["login"]
     avatar_url = github_user.get("avatar_url")
 
-    result = await db.execute(select(User).where(User.github_id == github_id))
-    user = result.scalar_one_or_none()
-
-    if user:
-        # Update existing user
-        user.username = username
-        user.email = primary_email or user.email
-        user.avatar_url = avatar_url or user.avatar_url
-        # Store the OAuth token if the column exists
-        try:
-            user.github_token = access_token
-        except Exception:
-            pass  # Column may not exist yet (migration pending)
-    else:
-        # Create new user
-        user = User(
-            github_id=github_id,
-            username=username,
-            email=primary_email,
-            avatar_url=avatar_url,
-        )
-        # Store the OAuth token if the column exists
-        try:
-            user.github_token = access_token
-        except Exception:
-            pass  # Column may not exist yet (migration pending)
-        db.add(user)
-
-    await db.commit()
-    await db.refresh(user)
+    # Single-statement upsert: atomic against concurrent logins of the same
+    # user, and no SELECT/refresh round trips
+    insert_stmt = pg_insert(User).values(
+        github_id=github_id,
+        username=username,
+        email=primary_email,
+        avatar_url=avatar_url,
+        github_token=access_token,
+    )
+    upsert_stmt = insert_stmt.on_conflict_do_update(
+        index_elements=[User.github_id],
+        set_={
+            "username": insert_stmt.excluded.username,
+            "email": func.coalesce(insert_stmt.excluded.email, User.email),
+            "avatar_url": func.coalesce(insert_stmt.excluded.avatar_url, User.avatar_url),
+            "github_token": insert_stmt.excluded.github_token,
+        },
+    ).returning(User.id)
+    user_id = (await db.execute(upsert_stmt)).scalar_one()
 
     # Auto-assign viewer role for personal repositories
     # Link repos that belong to the logged-in username
-    repo_rows = await db.execute(
-        select(Repo).where(Repo.repo_full_name.like(f"{username}/%"))
-    )
-    for repo in repo_rows.scalars().all():
-        existing_role = await db.execute(
-            select(UserRepoRole).where(
-                UserRepoRole.user_id == user.id,
-                UserRepoRole.repo_id == repo.id
+    # that the user has no role on yet
+    unlinked_repo_ids = await db.execute(
+        select(Repo.id)
+        .where(Repo.repo_full_name.like(f"{username}/%"))
+        .where(
+            ~exists().where(
+                UserRepoRole.user_id == user_id,
+                UserRepoRole.repo_id == Repo.id,
             )
         )
-        if not existing_role.scalar_one_or_none():
-            db.add(UserRepoRole(user_id=user.id, repo_id=repo.id, role="viewer"))
+    )
+    db.add_all(
+        UserRepoRole(user_id=user_id, repo_id=repo_id, role="viewer")
+        for repo_id in unlinked_repo_ids.scalars()
+    )
+    # The upsert and the role links share one transaction and one commit
     await db.commit()
+    _USER_CACHE.pop(user_id, None)
+    await invalidate_managed_repos(user_id)
 
     # Create session token
-    session_token = create_session_token(user.id)
+    session_token = create_session_token(user_id)
 
     # Build frontend callback from configured FRONTEND_ORIGIN
     frontend_origin = settings.FRONTEND_ORIGIN or (settings.CORS_ORIGINS[0] if settings.CORS_ORIGINS else "http://localhost:8080")
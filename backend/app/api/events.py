@@ -1,7 +1,9 @@
 """Server-Sent Events (SSE) endpoint for real-time updates."""
 import asyncio
-import json
-from typing import AsyncIterator, Optional
+import socket
+from contextlib import suppress
+import orjson
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
 from fastapi import APIRouter, Request, HTTPException, Depends
 from fastapi.responses import StreamingResponse
 import redis.asyncio as aioredis
@@ -19,62 +21,205 @@ router = APIRouter()
 # Global Redis client for pub/sub
 redis_pubsub: aioredis.Redis = None
 
+# Seconds of silence before a heartbeat comment is sent to an idle stream
+HEARTBEAT_INTERVAL = 15.0
+
+# Bursts are written to the client as one chunk: up to this many frames
+# arriving within this many seconds of the first one
+MAX_BATCH_FRAMES = 16
+MAX_BATCH_DELAY = 0.005
+
+# Frames buffered per stream; a client that falls this far behind is
+# disconnected instead of growing process memory without bound
+MAX_QUEUED_FRAMES = 256
+
+USER_CHANNEL_PATTERN = "user:*:events"
+BROADCAST_CHANNEL = "broadcast:events"
+_BROADCAST_CHANNEL_BYTES = BROADCAST_CHANNEL.encode()
+
+# One Redis subscription per process instead of one per SSE client: the
+# dispatcher task pattern-subscribes to every user channel and routes each
+# message to the queues of that user's open streams (broadcasts go to all).
+_SUBSCRIBERS: Dict[int, Set[asyncio.Queue]] = {}
+_dispatch_task: Optional[asyncio.Task] = None
+
+# Frames are written as bytes; the static ones are built once.
+_CONNECTED_TMPL = b'data: {"type":"connected","user_id":%d}\n\n'
+_HEARTBEAT = b": heartbeat\n\n"
+_UNAVAILABLE_FRAME = b'data: {"type":"error","message":"SSE unavailable"}\n\n'
+
+
+def _frame(payload: Any) -> bytes:
+    """Encode one SSE data frame."""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
 
 async def init_redis_pubsub():
-    """Initialize Redis pub/sub client."""
+    """Initialize Redis pub/sub client (called from the app lifespan)."""
     global redis_pubsub
     if redis_pubsub is None:
+        # Payloads are parsed straight from bytes, so responses are not
+        # decoded. No socket_timeout: the shared subscription blocks in
+        # listen() indefinitely, and keepalive probes detect dead peers.
+        keepalive_options = {socket.TCP_KEEPIDLE: 30} if hasattr(socket, "TCP_KEEPIDLE") else None
         redis_pubsub = await aioredis.from_url(
             settings.REDIS_URL,
-            encoding="utf-8",
-            decode_responses=True
+            decode_responses=False,
+            max_connections=64,
+            socket_connect_timeout=5,
+            socket_keepalive=True,
+            socket_keepalive_options=keepalive_options,
+            health_check_interval=30,
+            retry_on_timeout=True,
         )
+    # Subscribe up front so the first stream doesn't wait on it
+    _ensure_dispatcher()
+
+
+async def close_redis_pubsub():
+    """Stop the dispatcher and close the Redis pub/sub client."""
+    global redis_pubsub, _dispatch_task
+    if _dispatch_task is not None:
+        # Wait for the dispatcher to close its subscription before the
+        # client it was taken from goes away
+        _dispatch_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await _dispatch_task
+        _dispatch_task = None
+    if redis_pubsub is not None:
+        await redis_pubsub.close()
+        redis_pubsub = None
+
 
+def _unsubscribe(user_id: int, queue: asyncio.Queue) -> None:
+    """Stop routing messages to a stream's queue."""
+    subscribers = _SUBSCRIBERS.get(user_id)
+    if subscribers is not None:
+        subscribers.discard(queue)
+        if not subscribers:
+            del _SUBSCRIBERS[user_id]
 
-async def event_stream(user_id: int) -> AsyncIterator[str]:
+
+def _close_stream(queue: asyncio.Queue) -> None:
+    """End a stream, discarding frames it has not read if the queue is full."""
+    if queue.full():
+        while not queue.empty():
+            queue.get_nowait()
+    queue.put_nowait(None)
+
+
+def _deliver(user_id: int, queue: asyncio.Queue, chunk: bytes) -> None:
+    """Queue a frame for a stream, dropping the stream if it is not keeping up."""
+    try:
+        queue.put_nowait(chunk)
+    except asyncio.QueueFull:
+        logger.warning(f"Dropping SSE stream of user {user_id}: {MAX_QUEUED_FRAMES} frames unread")
+        _unsubscribe(user_id, queue)
+        _close_stream(queue)
+
+
+async def _dispatch() -> None:
+    """Route messages from the shared subscription to per-user stream queues."""
+    pubsub = redis_pubsub.pubsub()
+    try:
+        await pubsub.psubscribe(USER_CHANNEL_PATTERN)
+        await pubsub.subscribe(BROADCAST_CHANNEL)
+        async for message in pubsub.listen():
+            if message["type"] not in ("message", "pmessage"):
+                continue
+            try:
+                event_data = orjson.loads(message["data"])
+            except orjson.JSONDecodeError:
+                logger.warning(f"Invalid JSON in SSE event: {message['data']!r}")
+                continue
+            chunk = _frame(event_data)
+            
+            channel = message["channel"]
+            if channel == _BROADCAST_CHANNEL_BYTES:
+                targets = [(user_id, queue) for user_id, queues in _SUBSCRIBERS.items() for queue in queues]
+            else:
+                try:
+                    user_id = int(channel.split(b":")[1])
+                except (IndexError, ValueError):
+                    continue
+                targets = [(user_id, queue) for queue in _SUBSCRIBERS.get(user_id, ())]
+            for user_id, queue in targets:
+                _deliver(user_id, queue, chunk)
+    except Exception as e:
+        logger.error(f"Error in event stream: {e}", exc_info=True)
+        error_chunk = _frame({"type": "error", "message": str(e)})
+        for queues in _SUBSCRIBERS.values():
+            for queue in queues:
+                if not queue.full():
+                    queue.put_nowait(error_chunk)
+                _close_stream(queue)
+    finally:
+        await pubsub.close()
+
+
+def _ensure_dispatcher() -> None:
+    """Start the shared dispatcher, or restart it if it has stopped."""
+    global _dispatch_task
+    if _dispatch_task is None or _dispatch_task.done():
+        _dispatch_task = asyncio.create_task(_dispatch())
+
+
+async def _collect_batch(queue: asyncio.Queue, first: bytes) -> Tuple[List[bytes], bool]:
+    """Gather frames that arrive within MAX_BATCH_DELAY of `first`.
+
+    Returns the frames (at most MAX_BATCH_FRAMES) and whether the stream was
+    closed while collecting.
+    """
+    frames = [first]
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + MAX_BATCH_DELAY
+    while len(frames) < MAX_BATCH_FRAMES:
+        try:
+            chunk = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                chunk = await asyncio.wait_for(queue.get(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+        if chunk is None:
+            return frames, True
+        frames.append(chunk)
+    return frames, False
+
+
+async def event_stream(user_id: int) -> AsyncIterator[bytes]:
     """Generate SSE event stream for user."""
-    await init_redis_pubsub()
-    
     if not redis_pubsub:
         logger.error("Redis pub/sub not initialized")
-        yield f"data: {json.dumps({'type': 'error', 'message': 'SSE unavailable'})}\n\n"
+        yield _UNAVAILABLE_FRAME
         return
     
-    # Create channels for user-specific events and broadcast
-    channel = f"user:{user_id}:events"
-    broadcast_channel = "broadcast:events"
-    pubsub = redis_pubsub.pubsub()
-    await pubsub.subscribe(channel)
-    await pubsub.subscribe(broadcast_channel)
-    
-    # Send initial connection event
-    yield f"data: {json.dumps({'type': 'connected', 'user_id': user_id})}\n\n"
+    _ensure_dispatcher()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=MAX_QUEUED_FRAMES)
+    _SUBSCRIBERS.setdefault(user_id, set()).add(queue)
     
     try:
+        # Send initial connection event
+        yield _CONNECTED_TMPL % user_id
+        
         while True:
-            # Check for messages with timeout
-            message = await asyncio.wait_for(pubsub.get_message(timeout=1.0), timeout=30.0)
-            
-            if message and message["type"] == "message":
-                try:
-                    event_data = json.loads(message["data"])
-                    yield f"data: {json.dumps(event_data)}\n\n"
-                except json.JSONDecodeError:
-                    logger.warning(f"Invalid JSON in SSE event: {message['data']}")
-            else:
+            try:
+                chunk = await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_INTERVAL)
+            except asyncio.TimeoutError:
                 # Send heartbeat to keep connection alive
-                yield f": heartbeat\n\n"
-                
-    except asyncio.TimeoutError:
-        # Timeout - send ping to check if client is still connected
-        yield f": ping\n\n"
-    except Exception as e:
-        logger.error(f"Error in event stream: {e}", exc_info=True)
-        yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+                yield _HEARTBEAT
+                continue
+            if chunk is None:
+                break
+            frames, closed = await _collect_batch(queue, chunk)
+            yield b"".join(frames)
+            if closed:
+                break
     finally:
-        await pubsub.unsubscribe(channel)
-        await pubsub.unsubscribe(broadcast_channel)
-        await pubsub.close()
+        _unsubscribe(user_id, queue)
 
 
 @router.get("/stream")
@@ -1,19 +1,32 @@
+import asyncio
 from typing import List, Optional, Dict, Any
+import httpx
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select
 
 from app.adapters.db import get_db
+from app.adapters.http import get_http_client
 from app.api.auth import get_current_user
 from app.models.user import User
 from app.models.repo import Repo, UserRepoRole
 from app.schemas.user import UserResponse
 from app.logging_config import get_logger
+from app.services import github_auth
+from app.services.repo_access import get_managed_repos
 from app.integrations.github.client import list_installation_repositories
 
 logger = get_logger(__name__)
 router = APIRouter()
 
+# Max concurrent per-installation requests to GitHub
+_INSTALLATION_FANOUT = 8
+
+# /user/installations responses are cached per user with their ETag so that
+# repeat fetches are conditional; a 304 does not count against the rate limit
+_INSTALLATIONS_CACHE_TTL = 60
+
 
 @router.get("/github/me", response_model=UserResponse)
 async def github_me(
@@ -23,15 +36,7 @@ async def github_me(
     if not current_user:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
-    # Compute managed repos similarly to /api/me
-    result = await db.execute(
-        select(Repo)
-        .join(UserRepoRole)
-        .where(UserRepoRole.user_id == current_user.id)
-        .where(UserRepoRole.role.in_(["admin", "maintainer", "manager"]))
-    )
-    repos = result.scalars().all()
-    managed_repos = [repo.repo_full_name for repo in repos]
+    managed_repos = await get_managed_repos(current_user.id, db)
 
     return UserResponse(
         id=str(current_user.id),
@@ -43,10 +48,52 @@ async def github_me(
     )
 
 
+async def _fetch_user_installations(
+    client: httpx.AsyncClient,
+    user_id: int,
+    headers: Dict[str, str],
+) -> Dict[str, Any]:
+    """Fetch /user/installations, revalidating a Redis-cached copy via ETag."""
+    cache_key = f"gh:user:{user_id}:installations"
+    cached: Dict[str, str] = {}
+    redis_client = github_auth.redis_client
+    if redis_client:
+        try:
+            cached = await redis_client.hgetall(cache_key)
+        except Exception as e:
+            logger.warning(f"Error reading installations cache: {e}")
+
+    request_headers = dict(headers)
+    if cached.get("etag"):
+        request_headers["If-None-Match"] = cached["etag"]
+
+    response = await client.get(
+        "https://api.github.com/user/installations",
+        headers=request_headers,
+        params={"per_page": 100},
+        timeout=10.0,
+    )
+    if response.status_code == 304 and cached.get("body"):
+        return orjson.loads(cached["body"])
+
+    response.raise_for_status()
+    etag = response.headers.get("ETag")
+    if redis_client and etag:
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.hset(cache_key, mapping={"etag": etag, "body": response.text})
+                pipe.expire(cache_key, _INSTALLATIONS_CACHE_TTL)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Error caching installations: {e}")
+    return orjson.loads(response.content)
+
+
 @router.get("/github/installations")
 async def list_user_installations(
     current_user: Optional[User] = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    client: httpx.AsyncClient = Depends(get_http_client),
 ):
     if not current_user:
         raise HTTPException(status_code=401, detail="Not authenticated")
@@ -59,42 +106,38 @@ async def list_user_installations(
         return {"installations": []}
 
     try:
-        import httpx
-        async with httpx.AsyncClient() as client:
-            # Get user's app installations via GitHub API
-            # Use the user's OAuth token to list installations accessible to that user
-            headers = {
-                "Authorization": f"token {github_token}",
-                "Accept": "application/vnd.github+json",
-            }
-            response = await client.get(
-                "https://api.github.com/user/installations",
-                headers=headers,
-                timeout=10.0,
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            installations = []
-            for install in data.get("installations", []):
-                installation_id = install.get("id")
-                
-                # Get repo count for this installation
+        # Get user's app installations via GitHub API
+        # Use the user's OAuth token to list installations accessible to that user
+        headers = {
+            "Authorization": f"token {github_token}",
+            "Accept": "application/vnd.github+json",
+        }
+        data = await _fetch_user_installations(client, current_user.id, headers)
+        
+        # Count repos per installation concurrently. A single-item page is
+        # enough since GitHub reports the full total_count on every page.
+        semaphore = asyncio.Semaphore(_INSTALLATION_FANOUT)
+
+        async def _repo_count(installation_id: int) -> int:
+            async with semaphore:
                 repo_count_response = await client.get(
                     f"https://api.github.com/user/installations/{installation_id}/repositories",
                     headers=headers,
+                    params={"per_page": 1},
                     timeout=10.0,
                 )
-                repo_count_response.raise_for_status()
-                repo_count = len(repo_count_response.json().get("repositories", []))
-                
-                installations.append({
-                    "installation_id": installation_id,
-                    "repo_count": repo_count,
-                })
-            
-            logger.info(f"Retrieved {len(installations)} GitHub App installations for user {current_user.id}")
-            return {"installations": installations}
+            repo_count_response.raise_for_status()
+            return repo_count_response.json().get("total_count", 0)
+
+        installation_ids = [install.get("id") for install in data.get("installations", [])]
+        repo_counts = await asyncio.gather(*(_repo_count(i) for i in installation_ids))
+        installations = [
+            {"installation_id": installation_id, "repo_count": repo_count}
+            for installation_id, repo_count in zip(installation_ids, repo_counts)
+        ]
+        
+        logger.info(f"Retrieved {len(installations)} GitHub App installations for user {current_user.id}")
+        return {"installations": installations}
     
     except Exception as e:
         logger.error(f"Failed to list GitHub installations for user {current_user.id}: {e}", exc_info=True)
@@ -106,25 +149,28 @@ async def list_installation_repos(
     installation_id: int,
     current_user: Optional[User] = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    client: httpx.AsyncClient = Depends(get_http_client),
 ):
     if not current_user:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
     # Optional: verify the user has access to at least one repo for this installation
     access_check = await db.execute(
-        select(func.count(Repo.id))
+        select(1)
+        .select_from(Repo)
         .join(UserRepoRole)
         .where(UserRepoRole.user_id == current_user.id)
         .where(Repo.installation_id == installation_id)
+        .limit(1)
     )
-    if (access_check.scalar() or 0) == 0:
+    if access_check.scalar() is None:
         # No local repos mapped yet; still allow listing from GitHub to fix empty state
         logger.info(
             f"User {current_user.id} requested repos for installation {installation_id} with no local mapping"
         )
 
     try:
-        data = await list_installation_repositories(installation_id)
+        data = await list_installation_repositories(client, installation_id)
     except Exception as e:
         logger.error(f"Failed to list installation repositories: {e}", exc_info=True)
         raise HTTPException(status_code=502, detail="Failed to fetch repositories from GitHub")
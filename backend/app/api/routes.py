@@ -1,26 +1,32 @@
 """Main API routes."""
+from collections import Counter
 from typing import List, Optional
+import httpx
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, insert, func, and_, true
+from sqlalchemy.orm import contains_eager, load_only, selectinload
 
 from app.adapters.db import get_db
+from app.adapters.http import get_http_client
+from app.adapters.jobs import enqueue
 from app.api.auth import get_current_user
 from app.models.user import User
 from app.models.repo import Repo, UserRepoRole
-from app.models.issue import Issue, ChecklistItem
+from app.models.issue import Issue, ChecklistItem, ISSUE_STATUSES
 from app.models.pr import PullRequest
 from app.schemas.user import UserResponse
 from app.schemas.repo import RepoSummaryResponse
 from app.schemas.issue import IssueResponse, ChecklistItemResponse, ChecklistSummary
 from app.schemas.pr import PRDetailResponse, TestResultResponse, CodeHealthIssueResponse, SuggestedTestResponse, CoverageAdviceResponse, PRListItemResponse
 from app.schemas.notification import NotificationResponse
-from app.models.pr import PullRequest, TestResult
+from app.models.pr import PullRequest, TestResult, PR_VALIDATION_STATUSES
 from app.models.code_health import CodeHealth
-from app.services.github_auth import get_github_api_client_async
+from app.services.github_auth import github_api_headers
 from app.models.audit import AuditLog
 from app.services.notifications import get_user_notifications, mark_notification_read
+from app.services.repo_access import get_managed_repos
 from app.config import get_settings
 from app.logging_config import get_logger
 
@@ -28,6 +34,57 @@ logger = get_logger(__name__)
 settings = get_settings()
 router = APIRouter()
 
+# Issue.status -> the status names the frontend uses
+_ISSUE_STATUS_LABELS = {
+    "pending": "processing",
+    "processed": "completed",
+    "needs_attention": "open",
+}
+
+# Notification.kind -> frontend notification type
+_NOTIFICATION_TYPES = {
+    "checklist_ready": "success",
+    "pr_validated": "info",
+    "repo_event": "info",
+}
+
+# Fallbacks for fields a stored code health finding may lack; keys the
+# response schema doesn't define are ignored
+_FINDING_DEFAULTS = {
+    "severity": "low",
+    "category": "unknown",
+    "message": "",
+    "file_path": "",
+}
+
+# repo_full_name -> Repo.id for the /repos/{owner}/{repo}/... endpoints.
+# Repos are created by the workers and never renamed or deleted in place,
+# and misses are not cached, so a short TTL is all the invalidation needed.
+_REPO_ID_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+
+async def get_repo_id(
+    owner: str,
+    repo: str,
+    current_user: Optional[User] = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> int:
+    """Resolve the owner/repo path parameters to a repo id, or fail with 401/404."""
+    if not current_user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+
+    repo_full_name = f"{owner}/{repo}"
+    repo_id = _REPO_ID_CACHE.get(repo_full_name)
+    if repo_id is None:
+        result = await db.execute(
+            select(Repo.id).where(Repo.repo_full_name == repo_full_name)
+        )
+        repo_id = result.scalar_one_or_none()
+        if repo_id is None:
+            raise HTTPException(status_code=404, detail="Repository not found")
+        _REPO_ID_CACHE[repo_full_name] = repo_id
+    return repo_id
+
 
 @router.get("/me", response_model=UserResponse)
 async def get_me(
@@ -38,15 +95,7 @@ async def get_me(
     if not current_user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     
-    # Get user's managed repos
-    result = await db.execute(
-        select(Repo)
-        .join(UserRepoRole)
-        .where(UserRepoRole.user_id == current_user.id)
-        .where(UserRepoRole.role.in_(["admin", "maintainer", "manager"]))
-    )
-    repos = result.scalars().all()
-    managed_repos = [repo.repo_full_name for repo in repos]
+    managed_repos = await get_managed_repos(current_user.id, db)
     
     return UserResponse(
         id=str(current_user.id),
@@ -62,6 +111,7 @@ async def get_me(
 async def get_repos(
     current_user: Optional[User] = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    http_client: httpx.AsyncClient = Depends(get_http_client),
     filter: Optional[str] = Query(None)
 ):
     """List user's managed repos."""
@@ -79,18 +129,6 @@ async def get_repos(
     
     repos = []
     for repo, role in repo_rows:
-        # Get PR count
-        pr_count_result = await db.execute(
-            select(func.count(PullRequest.id)).where(PullRequest.repo_id == repo.id)
-        )
-        pr_count = pr_count_result.scalar() or 0
-        
-        # Get issue count
-        issue_count_result = await db.execute(
-            select(func.count(Issue.id)).where(Issue.repo_id == repo.id)
-        )
-        issue_count = issue_count_result.scalar() or 0
-        
         # Recent PR numbers (by created_at)
         recent_prs_result = await db.execute(
             select(PullRequest.pr_number)
@@ -116,18 +154,17 @@ async def get_repos(
         stars = 0
         languages_list: List[str] = []
         last_activity = None
-        owner, name = repo.repo_full_name.split("/", 1)
         if repo.is_installed and repo.installation_id:
             try:
-                client = await get_github_api_client_async(repo.installation_id)
-                repo_resp = await client.get(f"/repos/{repo.repo_full_name}")
+                headers = await github_api_headers(repo.installation_id)
+                repo_url = f"{settings.GITHUB_API_BASE}/repos/{repo.repo_full_name}"
+                repo_resp = await http_client.get(repo_url, headers=headers)
                 repo_json = repo_resp.json()
                 stars = int(repo_json.get("stargazers_count") or 0)
                 last_activity = repo_json.get("pushed_at")
-                langs_resp = await client.get(f"/repos/{repo.repo_full_name}/languages")
+                langs_resp = await http_client.get(f"{repo_url}/languages", headers=headers)
                 langs_json = langs_resp.json() or {}
                 languages_list = list(langs_json.keys())[:5]
-                await client.aclose()
             except Exception:
                 pass
 
@@ -155,12 +192,12 @@ async def get_repos(
         
         repos.append(RepoSummaryResponse(
             repo_full_name=repo.repo_full_name,
-            owner=owner,
-            name=name,
+            owner=repo.owner,
+            name=repo.name,
             health_score=health_score,
             is_installed=repo.is_installed,
-            pr_count=pr_count,
-            issue_count=issue_count,
+            pr_count=repo.pr_count,
+            issue_count=repo.issue_count,
             recent_pr_numbers=recent_pr_numbers,
             recent_issue_numbers=recent_issue_numbers,
             last_activity=last_activity,
@@ -176,43 +213,35 @@ async def get_repo(
     owner: str,
     repo: str,
     current_user: Optional[User] = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    http_client: httpx.AsyncClient = Depends(get_http_client),
 ):
     """Get repo details."""
     if not current_user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     
     repo_full_name = f"{owner}/{repo}"
+    # Repo and the caller's role (NULL when they have none) at once
     result = await db.execute(
-        select(Repo).where(Repo.repo_full_name == repo_full_name)
-    )
-    repo_obj = result.scalar_one_or_none()
-    
-    if not repo_obj:
-        raise HTTPException(status_code=404, detail="Repository not found")
-    
-    # Check access
-    role_result = await db.execute(
-        select(UserRepoRole).where(
+        select(Repo, UserRepoRole.role)
+        .outerjoin(
+            UserRepoRole,
             and_(
+                UserRepoRole.repo_id == Repo.id,
                 UserRepoRole.user_id == current_user.id,
-                UserRepoRole.repo_id == repo_obj.id
-            )
+            ),
         )
+        .where(Repo.repo_full_name == repo_full_name)
     )
-    if not role_result.scalar_one_or_none():
-        raise HTTPException(status_code=403, detail="Access denied")
+    row = result.first()
     
-    # Get counts
-    pr_count_result = await db.execute(
-        select(func.count(PullRequest.id)).where(PullRequest.repo_id == repo_obj.id)
-    )
-    pr_count = pr_count_result.scalar() or 0
+    if row is None:
+        raise HTTPException(status_code=404, detail="Repository not found")
+    repo_obj, role = row
     
-    issue_count_result = await db.execute(
-        select(func.count(Issue.id)).where(Issue.repo_id == repo_obj.id)
-    )
-    issue_count = issue_count_result.scalar() or 0
+    # Check access
+    if role is None:
+        raise HTTPException(status_code=403, detail="Access denied")
     
     health_score = 85
     
@@ -240,15 +269,15 @@ async def get_repo(
     last_activity = None
     if repo_obj.is_installed and repo_obj.installation_id:
         try:
-            client = await get_github_api_client_async(repo_obj.installation_id)
-            repo_resp = await client.get(f"/repos/{repo_obj.repo_full_name}")
+            headers = await github_api_headers(repo_obj.installation_id)
+            repo_url = f"{settings.GITHUB_API_BASE}/repos/{repo_obj.repo_full_name}"
+            repo_resp = await http_client.get(repo_url, headers=headers)
             repo_json = repo_resp.json()
             stars = int(repo_json.get("stargazers_count") or 0)
             last_activity = repo_json.get("pushed_at")
-            langs_resp = await client.get(f"/repos/{repo_obj.repo_full_name}/languages")
+            langs_resp = await http_client.get(f"{repo_url}/languages", headers=headers)
             langs_json = langs_resp.json() or {}
             languages_list = list(langs_json.keys())[:5]
-            await client.aclose()
         except Exception:
             pass
 
@@ -258,8 +287,8 @@ async def get_repo(
         name=repo,
         health_score=health_score,
         is_installed=repo_obj.is_installed,
-        pr_count=pr_count,
-        issue_count=issue_count,
+        pr_count=repo_obj.pr_count,
+        issue_count=repo_obj.issue_count,
         recent_pr_numbers=recent_pr_numbers,
         recent_issue_numbers=recent_issue_numbers,
         last_activity=last_activity,
@@ -291,6 +320,7 @@ async def get_issues(
     q: Optional[str] = Query(None),
     sort: Optional[str] = Query("updated"),
     order: Optional[str] = Query("desc"),
+    repo_id: int = Depends(get_repo_id),
     current_user: Optional[User] = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -299,17 +329,35 @@ async def get_issues(
         raise HTTPException(status_code=401, detail="Not authenticated")
     
     repo_full_name = f"{owner}/{repo}"
-    result = await db.execute(
-        select(Repo).where(Repo.repo_full_name == repo_full_name)
-    )
-    repo_obj = result.scalar_one_or_none()
-    
-    if not repo_obj:
-        raise HTTPException(status_code=404, detail="Repository not found")
     
-    # Get issues
-    query = select(Issue).where(Issue.repo_id == repo_obj.id)
+    # Get issues with their checklist tallies. The counts come from a
+    # LATERAL aggregate over each issue's items, so only numbers cross the
+    # wire and the whole page is one query.
+    checklist_counts = (
+        select(
+            func.count().label("total"),
+            func.count().filter(ChecklistItem.status == "passed").label("passed"),
+            func.count().filter(ChecklistItem.status == "failed").label("failed"),
+            func.count().filter(ChecklistItem.status == "pending").label("pending"),
+        )
+        .where(ChecklistItem.issue_id == Issue.id)
+        .lateral("checklist_counts")
+    )
+    query = (
+        select(
+            Issue,
+            checklist_counts.c.total,
+            checklist_counts.c.passed,
+            checklist_counts.c.failed,
+            checklist_counts.c.pending,
+        )
+        .join(checklist_counts, true())
+        .where(Issue.repo_id == repo_id)
+        .options(load_only(Issue.issue_number, Issue.title, Issue.status, Issue.created_at, Issue.updated_at))
+    )
     if status:
+        if status not in ISSUE_STATUSES:
+            return []
         query = query.where(Issue.status == status)
     if q:
         query = query.where(Issue.title.ilike(f"%{q}%"))
@@ -319,32 +367,15 @@ async def get_issues(
         query = query.order_by(Issue.updated_at.asc() if order == "asc" else Issue.updated_at.desc())
 
     issues_result = await db.execute(query.limit(100))
-    issues = issues_result.scalars().all()
     
+    # Every row shares the repo part of the URL
+    issues_url = f"https://github.com/{repo_full_name}/issues/"
     issue_responses = []
-    for issue in issues:
-        # Get checklist items for summary
-        checklist_result = await db.execute(
-            select(ChecklistItem).where(ChecklistItem.issue_id == issue.id)
-        )
-        checklist_items = checklist_result.scalars().all()
-        
-        total = len(checklist_items)
-        passed = sum(1 for item in checklist_items if item.status == "passed")
-        failed = sum(1 for item in checklist_items if item.status == "failed")
-        pending = sum(1 for item in checklist_items if item.status == "pending")
-        
-        # Map status
-        status_map = {
-            "pending": "processing",
-            "processed": "completed",
-            "needs_attention": "open",
-        }
-        
+    for issue, total, passed, failed, pending in issues_result.all():
         issue_responses.append(IssueResponse(
             issue_number=issue.issue_number,
             title=issue.title,
-            status=status_map.get(issue.status, "open"),
+            status=_ISSUE_STATUS_LABELS.get(issue.status, "open"),
             created_at=issue.created_at.isoformat(),
             updated_at=issue.updated_at.isoformat(),
             checklist_summary=ChecklistSummary(
@@ -353,7 +384,7 @@ async def get_issues(
                 failed=failed,
                 pending=pending,
             ),
-            github_url=f"https://github.com/{repo_full_name}/issues/{issue.issue_number}",
+            github_url=issues_url + str(issue.issue_number),
         ))
     
     return issue_responses
@@ -364,6 +395,7 @@ async def get_issue(
     owner: str,
     repo: str,
     issue_number: int,
+    repo_id: int = Depends(get_repo_id),
     current_user: Optional[User] = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -372,18 +404,20 @@ async def get_issue(
         raise HTTPException(status_code=401, detail="Not authenticated")
     
     repo_full_name = f"{owner}/{repo}"
-    repo_result = await db.execute(
-        select(Repo).where(Repo.repo_full_name == repo_full_name)
-    )
-    repo_obj = repo_result.scalar_one_or_none()
-    
-    if not repo_obj:
-        raise HTTPException(status_code=404, detail="Repository not found")
     
     issue_result = await db.execute(
         select(Issue)
-        .where(and_(Issue.repo_id == repo_obj.id, Issue.issue_number == issue_number))
-        .options(selectinload(Issue.checklist_items))
+        .where(and_(Issue.repo_id == repo_id, Issue.issue_number == issue_number))
+        .options(
+            load_only(Issue.issue_number, Issue.title, Issue.status, Issue.created_at, Issue.updated_at),
+            selectinload(Issue.checklist_items).load_only(
+                ChecklistItem.item_id,
+                ChecklistItem.text,
+                ChecklistItem.required,
+                ChecklistItem.status,
+                ChecklistItem.linked_test_ids,
+            ),
+        )
     )
     issue = issue_result.scalar_one_or_none()
     
@@ -393,31 +427,26 @@ async def get_issue(
     # Get checklist items
     checklist_items = issue.checklist_items
     total = len(checklist_items)
-    passed = sum(1 for item in checklist_items if item.status == "passed")
-    failed = sum(1 for item in checklist_items if item.status == "failed")
-    pending = sum(1 for item in checklist_items if item.status == "pending")
+    status_counts = Counter(item.status for item in checklist_items)
+    passed = status_counts["passed"]
+    failed = status_counts["failed"]
+    pending = status_counts["pending"]
     
     checklist_responses = [
         ChecklistItemResponse(
             id=item.item_id,
             text=item.text,
-            required=item.required == "true" if isinstance(item.required, str) else bool(item.required),
+            required=item.required,
             status=item.status,
             linked_tests=item.linked_test_ids or [],
         )
         for item in checklist_items
     ]
     
-    status_map = {
-        "pending": "processing",
-        "processed": "completed",
-        "needs_attention": "open",
-    }
-    
     return IssueResponse(
         issue_number=issue.issue_number,
         title=issue.title,
-        status=status_map.get(issue.status, "open"),
+        status=_ISSUE_STATUS_LABELS.get(issue.status, "open"),
         created_at=issue.created_at.isoformat(),
         updated_at=issue.updated_at.isoformat(),
         checklist_summary=ChecklistSummary(
@@ -438,6 +467,7 @@ async def update_checklist_item(
     issue_number: int,
     item_id: str,
     status_update: dict,
+    repo_id: int = Depends(get_repo_id),
     current_user: Optional[User] = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -445,30 +475,21 @@ async def update_checklist_item(
     if not current_user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     
-    repo_full_name = f"{owner}/{repo}"
-    repo_result = await db.execute(
-        select(Repo).where(Repo.repo_full_name == repo_full_name)
-    )
-    repo_obj = repo_result.scalar_one_or_none()
-    
-    if not repo_obj:
-        raise HTTPException(status_code=404, detail="Repository not found")
-    
     issue_result = await db.execute(
-        select(Issue).where(
-            and_(Issue.repo_id == repo_obj.id, Issue.issue_number == issue_number)
+        select(Issue.id).where(
+            and_(Issue.repo_id == repo_id, Issue.issue_number == issue_number)
         )
     )
-    issue = issue_result.scalar_one_or_none()
+    issue_id = issue_result.scalar_one_or_none()
     
-    if not issue:
+    if issue_id is None:
         raise HTTPException(status_code=404, detail="Issue not found")
     
     # Find checklist item
     item_result = await db.execute(
         select(ChecklistItem).where(
             and_(
-                ChecklistItem.issue_id == issue.id,
+                ChecklistItem.issue_id == issue_id,
                 ChecklistItem.item_id == item_id
             )
         )
@@ -495,6 +516,7 @@ async def regenerate_checklist(
     owner: str,
     repo: str,
     issue_number: int,
+    repo_id: int = Depends(get_repo_id),
     current_user: Optional[User] = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -503,32 +525,17 @@ async def regenerate_checklist(
         raise HTTPException(status_code=401, detail="Not authenticated")
     
     repo_full_name = f"{owner}/{repo}"
-    repo_result = await db.execute(
-        select(Repo).where(Repo.repo_full_name == repo_full_name)
-    )
-    repo_obj = repo_result.scalar_one_or_none()
-    
-    if not repo_obj:
-        raise HTTPException(status_code=404, detail="Repository not found")
     
     issue_result = await db.execute(
-        select(Issue).where(
-            and_(Issue.repo_id == repo_obj.id, Issue.issue_number == issue_number)
-        )
+        select(Issue)
+        .where(and_(Issue.repo_id == repo_id, Issue.issue_number == issue_number))
+        .options(load_only(Issue.issue_number, Issue.title, Issue.body))
     )
     issue = issue_result.scalar_one_or_none()
     
     if not issue:
         raise HTTPException(status_code=404, detail="Issue not found")
     
-    # Enqueue background job (will be implemented in workers phase)
-    from app.workers.tasks import generate_checklist
-    from rq import Queue
-    import redis
-    
-    redis_conn = redis.from_url(settings.REDIS_URL)
-    queue = Queue("default", connection=redis_conn)
-    
     # Create payload
     payload = {
         "action": "opened",
@@ -539,11 +546,11 @@ async def regenerate_checklist(
         },
         "repository": {
             "full_name": repo_full_name,
-            "id": repo_obj.id,
+            "id": repo_id,
         },
     }
     
-    job = queue.enqueue(generate_checklist, payload)
+    job = await enqueue("app.workers.tasks.generate_checklist", payload)
     
     return {"status": "accepted", "job_id": job.id}
 
@@ -553,6 +560,7 @@ async def get_pr(
     owner: str,
     repo: str,
     pr_number: int,
+    repo_id: int = Depends(get_repo_id),
     current_user: Optional[User] = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -561,18 +569,16 @@ async def get_pr(
         raise HTTPException(status_code=401, detail="Not authenticated")
     
     repo_full_name = f"{owner}/{repo}"
-    repo_result = await db.execute(
-        select(Repo).where(Repo.repo_full_name == repo_full_name)
-    )
-    repo_obj = repo_result.scalar_one_or_none()
-    
-    if not repo_obj:
-        raise HTTPException(status_code=404, detail="Repository not found")
     
     pr_result = await db.execute(
         select(PullRequest)
-        .where(and_(PullRequest.repo_id == repo_obj.id, PullRequest.pr_number == pr_number))
-        .options(selectinload(PullRequest.test_results), selectinload(PullRequest.code_health))
+        .where(and_(PullRequest.repo_id == repo_id, PullRequest.pr_number == pr_number))
+        .options(
+            selectinload(PullRequest.test_results).load_only(
+                TestResult.test_id, TestResult.name, TestResult.status, TestResult.checklist_ids
+            ),
+            selectinload(PullRequest.code_health),
+        )
     )
     pr = pr_result.scalar_one_or_none()
     
@@ -592,18 +598,11 @@ async def get_pr(
     ]
     
     # Get code health
-    code_health_list = []
-    if pr.code_health and pr.code_health.findings:
-        for idx, finding in enumerate(pr.code_health.findings or []):
-            code_health_list.append(CodeHealthIssueResponse(
-                id=f"ch{idx}",
-                severity=finding.get("severity", "low"),
-                category=finding.get("category", "unknown"),
-                message=finding.get("message", ""),
-                file_path=finding.get("file_path", ""),
-                line_number=finding.get("line_number"),
-                suggestion=finding.get("suggestion"),
-            ))
+    findings = pr.code_health.findings if pr.code_health else None
+    code_health_list = [
+        CodeHealthIssueResponse(**{**_FINDING_DEFAULTS, **finding, "id": f"ch{idx}"})
+        for idx, finding in enumerate(findings or [])
+    ]
     
     # Get health score
     health_score = pr.code_health.score if pr.code_health else 85
@@ -628,6 +627,44 @@ async def get_pr(
     )
 
 
+def _pr_list_query(repo_id: int, status: Optional[str], q: Optional[str], sort: Optional[str], order: Optional[str]):
+    """Select up to 50 of a repo's PRs, with code health joined for sorting and display."""
+    query = (
+        select(PullRequest)
+        .outerjoin(CodeHealth, CodeHealth.pr_id == PullRequest.id)
+        .where(PullRequest.repo_id == repo_id)
+        .options(contains_eager(PullRequest.code_health))
+    )
+    if status:
+        query = query.where(PullRequest.validation_status == status)
+    if q:
+        # PRs store no title; match the "PR #<number>" one the list shows
+        query = query.where(func.concat("PR #", PullRequest.pr_number).ilike(f"%{q}%"))
+
+    if sort == "created":
+        query = query.order_by(PullRequest.created_at.asc() if order == "asc" else PullRequest.created_at.desc())
+    elif sort == "health":
+        # PRs not analysed yet have no code_health row and sort last
+        score = CodeHealth.score.asc() if order == "asc" else CodeHealth.score.desc()
+        query = query.order_by(score.nulls_last())
+    else:
+        query = query.order_by(PullRequest.updated_at.asc() if order == "asc" else PullRequest.updated_at.desc())
+    return query.limit(50)
+
+
+def _pr_list_item(pr: PullRequest, pulls_url: str) -> PRListItemResponse:
+    """List entry for a PR loaded by _pr_list_query."""
+    return PRListItemResponse(
+        pr_number=pr.pr_number,
+        title=f"PR #{pr.pr_number}",
+        author="unknown",
+        created_at=pr.created_at.isoformat(),
+        health_score=pr.code_health.score if pr.code_health else 0,
+        validation_status=pr.validation_status,
+        github_url=pulls_url + str(pr.pr_number),
+    )
+
+
 @router.get("/repos/{owner}/{repo}/prs", response_model=List[PRListItemResponse])
 async def list_prs(
     owner: str,
@@ -636,47 +673,19 @@ async def list_prs(
     q: Optional[str] = Query(None),
     sort: Optional[str] = Query("updated"),
     order: Optional[str] = Query("desc"),
+    repo_id: int = Depends(get_repo_id),
     current_user: Optional[User] = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """List PRs for a repo with optional filters and sorting."""
     if not current_user:
         raise HTTPException(status_code=401, detail="Not authenticated")
-    repo_full_name = f"{owner}/{repo}"
-    repo_result = await db.execute(select(Repo).where(Repo.repo_full_name == repo_full_name))
-    repo_obj = repo_result.scalar_one_or_none()
-    if not repo_obj:
-        raise HTTPException(status_code=404, detail="Repository not found")
+    if status and status not in PR_VALIDATION_STATUSES:
+        return []
 
-    query = select(PullRequest).where(PullRequest.repo_id == repo_obj.id)
-    if status:
-        query = query.where(PullRequest.validation_status == status)
-    if q:
-        query = query.where(PullRequest.title.ilike(f"%{q}%"))
-
-    if sort == "created":
-        query = query.order_by(PullRequest.created_at.asc() if order == "asc" else PullRequest.created_at.desc())
-    elif sort == "health":
-        query = query.order_by(PullRequest.health_score.asc() if order == "asc" else PullRequest.health_score.desc())
-    else:
-        query = query.order_by(PullRequest.updated_at.asc() if order == "asc" else PullRequest.updated_at.desc())
-
-    rows = await db.execute(query.limit(50))
-    prs = rows.scalars().all()
-
-    items: List[PRListItemResponse] = []
-    for pr in prs:
-        items.append(PRListItemResponse(
-            pr_number=pr.pr_number,
-            title=pr.title or f"PR #{pr.pr_number}",
-            author=pr.author or "unknown",
-            created_at=pr.created_at.isoformat(),
-            health_score=pr.health_score or (pr.code_health.score if pr.code_health else 0),
-            validation_status=pr.validation_status,
-            github_url=f"https://github.com/{repo_full_name}/pull/{pr.pr_number}",
-        ))
-
-    return items
+    rows = await db.execute(_pr_list_query(repo_id, status, q, sort, order))
+    pulls_url = f"https://github.com/{owner}/{repo}/pull/"
+    return [_pr_list_item(pr, pulls_url) for pr in rows.scalars().all()]
 
 
 @router.post("/repos/{owner}/{repo}/prs/{pr_number}/revalidate", status_code=status.HTTP_202_ACCEPTED)
@@ -684,6 +693,7 @@ async def revalidate_pr(
     owner: str,
     repo: str,
     pr_number: int,
+    repo_id: int = Depends(get_repo_id),
     current_user: Optional[User] = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -691,32 +701,17 @@ async def revalidate_pr(
     if not current_user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     
-    repo_full_name = f"{owner}/{repo}"
-    repo_result = await db.execute(
-        select(Repo).where(Repo.repo_full_name == repo_full_name)
-    )
-    repo_obj = repo_result.scalar_one_or_none()
-    
-    if not repo_obj:
-        raise HTTPException(status_code=404, detail="Repository not found")
-    
     pr_result = await db.execute(
-        select(PullRequest).where(
-            and_(PullRequest.repo_id == repo_obj.id, PullRequest.pr_number == pr_number)
+        select(PullRequest.id).where(
+            and_(PullRequest.repo_id == repo_id, PullRequest.pr_number == pr_number)
         )
     )
-    pr = pr_result.scalar_one_or_none()
+    pr_id = pr_result.scalar_one_or_none()
     
-    if not pr:
+    if pr_id is None:
         raise HTTPException(status_code=404, detail="Pull request not found")
     
     # Enqueue revalidation (would trigger workflow run processing)
-    from rq import Queue
-    import redis
-    
-    redis_conn = redis.from_url(settings.REDIS_URL)
-    queue = Queue("default", connection=redis_conn)
-    
     # In real implementation, would trigger a new workflow run or re-process existing one
     # For now, just return accepted
     return {"status": "accepted", "message": "Revalidation queued"}
@@ -727,6 +722,7 @@ async def flag_for_merge(
     owner: str,
     repo: str,
     pr_number: int,
+    repo_id: int = Depends(get_repo_id),
     current_user: Optional[User] = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -735,36 +731,31 @@ async def flag_for_merge(
         raise HTTPException(status_code=401, detail="Not authenticated")
     
     repo_full_name = f"{owner}/{repo}"
-    repo_result = await db.execute(
-        select(Repo).where(Repo.repo_full_name == repo_full_name)
-    )
-    repo_obj = repo_result.scalar_one_or_none()
-    
-    if not repo_obj:
-        raise HTTPException(status_code=404, detail="Repository not found")
     
     pr_result = await db.execute(
-        select(PullRequest).where(
-            and_(PullRequest.repo_id == repo_obj.id, PullRequest.pr_number == pr_number)
+        select(PullRequest.id).where(
+            and_(PullRequest.repo_id == repo_id, PullRequest.pr_number == pr_number)
         )
     )
-    pr = pr_result.scalar_one_or_none()
+    pr_id = pr_result.scalar_one_or_none()
     
-    if not pr:
+    if pr_id is None:
         raise HTTPException(status_code=404, detail="Pull request not found")
     
-    # Create audit log
-    audit_log = AuditLog(
-        actor_user_id=current_user.id,
-        action="flag_for_merge",
-        target_type="pr",
-        target_id=pr.id,
-        details={
-            "pr_number": pr_number,
-            "repo_full_name": repo_full_name,
-        },
+    # Create audit log. A Core insert: nothing reads the row back, so there
+    # is no ORM identity to set up and no RETURNING of server defaults.
+    await db.execute(
+        insert(AuditLog).values(
+            actor_user_id=current_user.id,
+            action="flag_for_merge",
+            target_type="pr",
+            target_id=pr_id,
+            details={
+                "pr_number": pr_number,
+                "repo_full_name": repo_full_name,
+            },
+        )
     )
-    db.add(audit_log)
     await db.commit()
     
     return {"status": "recorded", "message": "Merge recommendation logged"}
@@ -781,25 +772,21 @@ async def get_notifications(
     
     notifications = await get_user_notifications(current_user.id, db)
     
-    # Map to response format
-    from app.models.repo import Repo
+    # Resolve repo names for the whole page in one query
+    repo_ids = {notif.repo_id for notif in notifications if notif.repo_id is not None}
+    repo_names = {}
+    if repo_ids:
+        repo_result = await db.execute(
+            select(Repo.id, Repo.repo_full_name).where(Repo.id.in_(repo_ids))
+        )
+        repo_names = dict(repo_result.all())
     
+    # Map to response format
     notification_responses = []
     for notif in notifications:
-        # Get repo full name
-        repo_result = await db.execute(
-            select(Repo).where(Repo.id == notif.repo_id)
-        )
-        repo = repo_result.scalar_one_or_none()
-        repo_full_name = repo.repo_full_name if repo else None
+        repo_full_name = repo_names.get(notif.repo_id)
         
-        # Map kind to type
-        type_map = {
-            "checklist_ready": "success",
-            "pr_validated": "info",
-            "repo_event": "info",
-        }
-        notif_type = type_map.get(notif.kind, "info")
+        notif_type = _NOTIFICATION_TYPES.get(notif.kind, "info")
         
         # Generate message from payload
         message = notif.kind.replace("_", " ").title()
@@ -842,6 +829,7 @@ async def mark_notification_read_endpoint(
 async def refresh_repo(
     owner: str,
     repo: str,
+    repo_id: int = Depends(get_repo_id),
     current_user: Optional[User] = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -850,16 +838,5 @@ async def refresh_repo(
         raise HTTPException(status_code=401, detail="Not authenticated")
 
     repo_full_name = f"{owner}/{repo}"
-    repo_result = await db.execute(select(Repo).where(Repo.repo_full_name == repo_full_name))
-    repo_obj = repo_result.scalar_one_or_none()
-    if not repo_obj:
-        raise HTTPException(status_code=404, detail="Repository not found")
-
-    from rq import Queue
-    import redis
-    from app.workers.tasks import refresh_repository
-
-    redis_conn = redis.from_url(settings.REDIS_URL)
-    queue = Queue("default", connection=redis_conn)
-    job = queue.enqueue(refresh_repository, {"repo_full_name": repo_full_name, "repo_id": repo_obj.id})
+    job = await enqueue("app.workers.tasks.refresh_repository", {"repo_full_name": repo_full_name, "repo_id": repo_id})
     return {"status": "accepted", "job_id": job.id}
@@ -1,20 +1,30 @@
 from typing import Any, Dict, Optional
 import httpx
 
-from app.services.github_auth import get_github_api_client_async, get_installation_token
+from app.config import get_settings
+from app.services.github_auth import get_installation_token
 from app.logging_config import get_logger
 
 logger = get_logger(__name__)
+settings = get_settings()
 
+# These helpers take the app's shared client (app.adapters.http) so calls
+# reuse its pooled connections; auth is passed per request.
 
-async def list_installation_repositories(installation_id: int) -> Dict[str, Any]:
-    client = await get_github_api_client_async(installation_id)
-    try:
-        resp = await client.get("/installation/repositories")
-        resp.raise_for_status()
-        return resp.json()
-    finally:
-        await client.aclose()
+
+async def list_installation_repositories(client: httpx.AsyncClient, installation_id: int) -> Dict[str, Any]:
+    token = await get_installation_token(installation_id)
+    if not token:
+        raise ValueError(f"Failed to get installation token for {installation_id}")
+    resp = await client.get(
+        f"{settings.GITHUB_API_BASE}/installation/repositories",
+        headers={
+            "Authorization": f"token {token}",
+            "Accept": "application/vnd.github+json",
+        },
+    )
+    resp.raise_for_status()
+    return resp.json()
 
 
 async def create_installation_access_token(installation_id: int) -> Optional[str]:
@@ -26,13 +36,15 @@ async def create_installation_access_token(installation_id: int) -> Optional[str
         return None
 
 
-async def get_authenticated_user(oauth_token: str) -> Optional[Dict[str, Any]]:
-    async with httpx.AsyncClient(base_url="https://api.github.com") as client:
-        try:
-            resp = await client.get("/user", headers={"Authorization": f"token {oauth_token}"})
-            resp.raise_for_status()
-            return resp.json()
-        except httpx.HTTPError as e:
-            logger.error(f"Failed to fetch authenticated user: {e}")
-            return None
+async def get_authenticated_user(client: httpx.AsyncClient, oauth_token: str) -> Optional[Dict[str, Any]]:
+    try:
+        resp = await client.get(
+            f"{settings.GITHUB_API_BASE}/user",
+            headers={"Authorization": f"token {oauth_token}"},
+        )
+        resp.raise_for_status()
+        return resp.json()
+    except httpx.HTTPError as e:
+        logger.error(f"Failed to fetch authenticated user: {e}")
+        return None
 
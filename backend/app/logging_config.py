@@ -1,39 +1,138 @@
 """Logging configuration for the application."""
+import json
 import logging
+import queue
 import sys
-import json
-from typing import Any
-from datetime import datetime
+import time
+import orjson
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional, Tuple
+
+# Request ID of the request being handled; asyncio copies the context into
+# each task, so concurrent requests never see each other's value
+request_id_var: ContextVar[str] = ContextVar("request_id", default="N/A")
+
+_base_record_factory = logging.getLogRecordFactory()
+
+
+def _record_factory(*args: Any, **kwargs: Any) -> logging.LogRecord:
+    """Stamp every record with the current request ID."""
+    record = _base_record_factory(*args, **kwargs)
+    record.request_id = request_id_var.get()
+    return record
+
+
+# Attributes every LogRecord carries; anything else on a record came from
+# extra= and is emitted as a top-level field
+_RESERVED_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {
+    "message",
+    "asctime",
+    "request_id",
+}
 
 
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
     
+    # (epoch second, its "YYYY-MM-DDTHH:MM:SS" UTC rendering); swapped as one
+    # tuple so concurrent handlers never pair a second with another's text
+    _second_cache: Tuple[int, str] = (-1, "")
+    
+    def _timestamp(self, created: float) -> str:
+        """ISO-8601 UTC timestamp; the date/time part is formatted once per second."""
+        second = int(created)
+        cached_second, prefix = self._second_cache
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._second_cache = (second, prefix)
+        return f"{prefix}.{int((created - second) * 1_000_000):06d}Z"
+    
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
+        # getMessage() is only needed for %-style arguments; our f-string
+        # log calls pass the finished message
+        msg = record.msg
+        message = msg if not record.args and isinstance(msg, str) else record.getMessage()
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
-            "message": record.getMessage(),
+            "message": message,
             "module": record.module,
             "function": record.funcName,
             "line": record.lineno,
+            # Always set by _record_factory
+            "request_id": record.request_id,
         }
         
-        # Add request ID if present
-        if hasattr(record, "request_id"):
-            log_data["request_id"] = record.request_id
-        
         # Add exception info if present
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
         
         # Add extra fields
-        if hasattr(record, "extra_fields"):
-            log_data.update(record.extra_fields)
+        for key in record.__dict__.keys() - _RESERVED_RECORD_ATTRS:
+            log_data[key] = record.__dict__[key]
         
-        return json.dumps(log_data)
+        # Unknown extra values fall back to str() and non-str dict keys are
+        # stringified; ints wider than 64 bits are only handled by the stdlib
+        try:
+            return orjson.dumps(log_data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            return json.dumps(log_data, default=str)
+
+
+class _RecordQueueHandler(QueueHandler):
+    """Queue handler that enqueues records untouched.
+
+    The stock prepare() formats the message on the calling thread; leaving
+    that to the listener's formatter keeps JSON encoding and exc_info
+    rendering off the event loop.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _DrainFlushListener(QueueListener):
+    """Queue listener that flushes its handlers whenever the queue runs dry.
+
+    Bursts of records are coalesced into one write; an idle process never
+    holds unflushed lines.
+    """
+    
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        if block and self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+        return self.queue.get(block)
+
+
+# Buffer for the stdout log stream, flushed by _DrainFlushListener
+_STDOUT_BUFFER_SIZE = 65536
+
+
+class _BufferedStdoutHandler(logging.StreamHandler):
+    """Stdout handler writing encoded records into a buffer without flushing."""
+    
+    def __init__(self):
+        super().__init__(
+            open(sys.stdout.fileno(), "wb", buffering=_STDOUT_BUFFER_SIZE, closefd=False)
+        )
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(f"{self.format(record)}{self.terminator}".encode())
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+# Background thread writing queued records to stdout; see setup_logging
+_listener: Optional[QueueListener] = None
+# Formatter choice (use_json) the running listener was built with
+_listener_json: Optional[bool] = None
 
 
 class StandardFormatter(logging.Formatter):
@@ -44,12 +143,6 @@ class StandardFormatter(logging.Formatter):
             fmt="%(asctime)s [%(levelname)s] [%(name)s] [%(request_id)s] %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S"
         )
-    
-    def format(self, record: logging.LogRecord) -> str:
-        """Format log record with request ID."""
-        if not hasattr(record, "request_id"):
-            record.request_id = "N/A"
-        return super().format(record)
 
 
 def setup_logging(use_json: bool = False, level: str = "INFO") -> None:
@@ -59,8 +152,21 @@ def setup_logging(use_json: bool = False, level: str = "INFO") -> None:
         use_json: If True, use JSON formatter. Otherwise use standard formatter.
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     """
+    global _listener, _listener_json
     log_level = getattr(logging, level.upper(), logging.INFO)
     
+    # Re-invoked with the same formatter (tests, reloads): keep the running
+    # handler and listener and only apply the level
+    if _listener is not None and _listener_json == use_json:
+        logging.getLogger().setLevel(log_level)
+        for handler in _listener.handlers:
+            handler.setLevel(log_level)
+        return
+    
+    # Installed before any handler so every record our formatters see
+    # carries request_id (read from request_id_var)
+    logging.setLogRecordFactory(_record_factory)
+    
     # Get root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
@@ -68,8 +174,9 @@ def setup_logging(use_json: bool = False, level: str = "INFO") -> None:
     # Remove existing handlers
     root_logger.handlers.clear()
     
-    # Create console handler
-    handler = logging.StreamHandler(sys.stdout)
+    # Create console handler, fed from a queue by a background listener so
+    # formatting and the stdout write never run on the request path
+    handler = _BufferedStdoutHandler()
     handler.setLevel(log_level)
     
     # Set formatter
@@ -79,7 +186,13 @@ def setup_logging(use_json: bool = False, level: str = "INFO") -> None:
         formatter = StandardFormatter()
     
     handler.setFormatter(formatter)
-    root_logger.addHandler(handler)
+    
+    shutdown_logging()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _listener = _DrainFlushListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+    _listener_json = use_json
+    root_logger.addHandler(_RecordQueueHandler(log_queue))
     
     # Set levels for third-party loggers
     logging.getLogger("uvicorn").setLevel(logging.WARNING)
@@ -88,6 +201,17 @@ def setup_logging(use_json: bool = False, level: str = "INFO") -> None:
     logging.getLogger("httpx").setLevel(logging.WARNING)
 
 
+def shutdown_logging() -> None:
+    """Stop the log listener, flushing records still in the queue."""
+    global _listener, _listener_json
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.flush()
+        _listener = None
+        _listener_json = None
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance with the given name.
     
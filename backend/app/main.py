@@ -1,18 +1,46 @@
 """FastAPI application entry point."""
-import uuid
+import functools
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-import logging
+from fastapi.responses import ORJSONResponse
 
 from app.config import get_settings
-from app.logging_config import setup_logging, get_logger
+from app.logging_config import setup_logging, shutdown_logging, get_logger
+from app.middleware.rate_limit import RateLimitMiddleware
+from app.middleware.request_id import RequestIDMiddleware
 
 logger = get_logger(__name__)
 settings = get_settings()
 
 
+def _cache_dependency_introspection() -> None:
+    """Memoize the callable-kind checks FastAPI repeats for every dependency.
+
+    fastapi.dependencies.utils.solve_dependencies re-runs inspect-based
+    is_*_callable checks for each Depends() on every request, although a
+    dependency's kind never changes. Unhashable callables bypass the cache.
+    """
+    import fastapi.dependencies.utils as dependency_utils
+
+    def _memoize(check):
+        cached = functools.lru_cache(maxsize=4096)(check)
+
+        def wrapper(call):
+            try:
+                return cached(call)
+            except TypeError:
+                return check(call)
+
+        return wrapper
+
+    for name in ("is_coroutine_callable", "is_gen_callable", "is_async_gen_callable"):
+        setattr(dependency_utils, name, _memoize(getattr(dependency_utils, name)))
+
+
+_cache_dependency_introspection()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
@@ -25,9 +53,13 @@ async def lifespan(app: FastAPI):
     from app.services.github_auth import init_redis, close_redis
     # Optional Mongo adapter
     from app.adapters.mongo import init_mongo, close_mongo
+    from app.adapters.http import shared_http_client, close_http_client
+    from app.api.events import init_redis_pubsub, close_redis_pubsub
     await init_db()
     await init_redis()
+    await init_redis_pubsub()
     await init_mongo()
+    app.state.http_client = shared_http_client()
     
     yield
     
@@ -35,7 +67,10 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down QuantumReview backend")
     await close_db()
     await close_redis()
+    await close_redis_pubsub()
     await close_mongo()
+    await close_http_client()
+    shutdown_logging()
 
 
 app = FastAPI(
@@ -44,9 +79,15 @@ app = FastAPI(
     lifespan=lifespan,
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
+    default_response_class=ORJSONResponse,
 )
 
 
+# Rate limiting, inside CORS so 429 responses still carry CORS headers
+if settings.RATE_LIMIT_PER_MINUTE > 0:
+    app.add_middleware(RateLimitMiddleware, requests_per_minute=settings.RATE_LIMIT_PER_MINUTE)
+
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -58,43 +99,19 @@ app.add_middleware(
 
 
 # Request ID middleware
-@app.middleware("http")
-async def add_request_id(request: Request, call_next):
-    """Add request ID to all requests."""
-    request_id = str(uuid.uuid4())
-    request.state.request_id = request_id
-    
-    # Add request ID to logger context
-    logger = get_logger(__name__)
-    old_factory = logging.getLogRecordFactory()
-    
-    def record_factory(*args, **kwargs):
-        record = old_factory(*args, **kwargs)
-        # Only set request_id if it hasn't been set already to avoid
-        # KeyError: "Attempt to overwrite 'request_id' in LogRecord" when
-        # callers pass the same key via `extra=` in logging calls.
-        if not hasattr(record, "request_id"):
-            record.request_id = request_id
-        return record
-    
-    logging.setLogRecordFactory(record_factory)
-    
-    response = await call_next(request)
-    response.headers["X-Request-ID"] = request_id
-    return response
+app.add_middleware(RequestIDMiddleware)
 
 
 # Error handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler."""
-    logger = get_logger(__name__)
     request_id = getattr(request.state, "request_id", "unknown")
     # Avoid passing `extra` to logger.error here because logging.makeRecord
     # can raise KeyError if the same key already exists on the LogRecord.
     # Include the request_id in the message instead.
     logger.error(f"Unhandled exception [{request_id}]: {exc}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
@@ -112,12 +129,12 @@ async def health_check():
 
 # Include routers
 from app.api import auth, routes, events, github as github_api
-from app.webhooks import github
+from app.webhooks import github as github_webhooks
 
 app.include_router(auth.router, prefix="/auth", tags=["auth"])
 app.include_router(routes.router, prefix="/api", tags=["api"])
 app.include_router(events.router, prefix="/events", tags=["events"])
-app.include_router(github.router, prefix="/webhooks", tags=["webhooks"])
+app.include_router(github_webhooks.router, prefix="/webhooks", tags=["webhooks"])
 app.include_router(github_api.router, prefix="/api", tags=["github"])
 
 
@@ -1,72 +1,91 @@
 """Rate limiting middleware."""
-import time
-from collections import defaultdict
-from typing import Dict, Tuple
-from fastapi import Request, HTTPException
-from starlette.middleware.base import BaseHTTPMiddleware
+from typing import Optional
+from fastapi.responses import ORJSONResponse
+from redis.commands.core import AsyncScript
+from starlette.types import ASGIApp, Receive, Scope, Send
+from app.services import github_auth
 from app.logging_config import get_logger
 
 logger = get_logger(__name__)
 
-# Simple in-memory rate limiter
-# In production, use Redis-based rate limiting
-_rate_limit_store: Dict[str, Tuple[int, float]] = defaultdict(lambda: (0, time.time()))
+# Sliding-window log kept in a Redis sorted set so every worker shares one
+# limit per IP: members are request times (microseconds), so no rolling
+# minute ever admits more than the limit, unlike fixed windows that allow a
+# 2x burst around the boundary. ARGV: window (microseconds), limit. Time
+# comes from the Redis server clock, so workers with skewed or stepped wall
+# clocks agree on the window. Rejected requests are not recorded.
+_SLIDING_WINDOW_LUA = """
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000000 + tonumber(clock[2])
+local window = tonumber(ARGV[1])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, now - window)
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[2]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], now, now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(window / 1000))
+return 1
+"""
 
+# Length of the sliding window in microseconds
+_WINDOW_US = 60_000_000
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Simple rate limiting middleware.
+
+def _client_ip(scope: Scope) -> str:
+    """Address of the client the limit is keyed on.
+
+    X-Forwarded-For is not read here: any client can send it. uvicorn's
+    proxy-headers support rewrites scope["client"] from it only when the
+    peer is a trusted proxy listed in FORWARDED_ALLOW_IPS.
+    """
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+class RateLimitMiddleware:
+    """Rate limiting middleware.
     
-    Limits requests per IP address.
-    For production, use Redis-based rate limiting.
+    Limits requests per IP address over a sliding one-minute window kept in
+    Redis. Requests are let through when Redis is unavailable.
     """
     
-    def __init__(self, app, requests_per_minute: int = 60):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, requests_per_minute: int = 60):
+        self.app = app
         self.requests_per_minute = requests_per_minute
-        self.window_seconds = 60
+        self._script: Optional[AsyncScript] = None
     
-    async def dispatch(self, request: Request, call_next):
-        # Get client IP
-        client_ip = request.client.host if request.client else "unknown"
-        
-        # Get rate limit key
-        key = f"rate_limit:{client_ip}"
-        
-        # Check current rate
-        count, window_start = _rate_limit_store[key]
-        current_time = time.time()
-        
-        # Reset window if expired
-        if current_time - window_start >= self.window_seconds:
-            count = 0
-            window_start = current_time
-        
-        # Check if limit exceeded
-        if count >= self.requests_per_minute:
-            logger.warning(f"Rate limit exceeded for {client_ip}")
-            raise HTTPException(
-                status_code=429,
-                detail=f"Rate limit exceeded. Max {self.requests_per_minute} requests per minute."
-            )
+    def _window_script(self, redis_client) -> AsyncScript:
+        """Script bound to the current Redis client; invoked via EVALSHA."""
+        if self._script is None or self._script.registered_client is not redis_client:
+            self._script = redis_client.register_script(_SLIDING_WINDOW_LUA)
+        return self._script
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
-        # Increment counter
-        count += 1
-        _rate_limit_store[key] = (count, window_start)
+        client_ip = _client_ip(scope)
         
-        # Clean up old entries (simple cleanup every 100 requests)
-        if count == 1 and len(_rate_limit_store) > 1000:
-            self._cleanup_old_entries(current_time)
+        redis_client = github_auth.redis_client
+        if redis_client:
+            try:
+                allowed = await self._window_script(redis_client)(
+                    keys=[f"rate_limit:{client_ip}"],
+                    args=[_WINDOW_US, self.requests_per_minute],
+                )
+            except Exception as e:
+                logger.warning(f"Error checking rate limit: {e}")
+                allowed = 1
+            
+            if not allowed:
+                logger.warning(f"Rate limit exceeded for {client_ip}")
+                response = ORJSONResponse(
+                    status_code=429,
+                    content={"detail": f"Rate limit exceeded. Max {self.requests_per_minute} requests per minute."},
+                )
+                await response(scope, receive, send)
+                return
         
         # Process request
-        response = await call_next(request)
-        return response
-    
-    def _cleanup_old_entries(self, current_time: float):
-        """Remove entries older than window."""
-        keys_to_remove = [
-            key for key, (count, window_start) in _rate_limit_store.items()
-            if current_time - window_start >= self.window_seconds
-        ]
-        for key in keys_to_remove:
-            del _rate_limit_store[key]
-
+        await self.app(scope, receive, send)
@@ -0,0 +1,37 @@
+"""Request ID middleware."""
+import os
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.logging_config import request_id_var
+
+
+class RequestIDMiddleware:
+    """Tag every HTTP request with a random ID.
+    
+    The ID is stored on request.state, attached to log records through
+    request_id_var and returned in the X-Request-ID header. Written as plain
+    ASGI so responses pass straight through instead of being re-streamed by
+    BaseHTTPMiddleware.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        request_id = os.urandom(16).hex()
+        scope.setdefault("state", {})["request_id"] = request_id
+        
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
+        
+        token = request_id_var.set(request_id)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_var.reset(token)
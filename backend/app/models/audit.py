@@ -1,7 +1,8 @@
 """Audit and notification models."""
-from sqlalchemy import Column, String, Integer, ForeignKey, Text, JSON, Boolean
+from sqlalchemy import Column, BigInteger, Integer, ForeignKey, Text, Boolean, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
-from app.models.base import Base, TimestampMixin
+from app.models.base import Base, InternedString, TimestampMixin
 
 
 class Report(Base, TimestampMixin):
@@ -22,12 +23,16 @@ class Report(Base, TimestampMixin):
 class Notification(Base, TimestampMixin):
     """Notification model."""
     __tablename__ = "notifications"
+    __table_args__ = (
+        Index("ix_notifications_user_read_created", "user_id", "read", text("created_at DESC")),
+    )
     
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True, index=True)
+    id = Column(BigInteger, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True)
     repo_id = Column(Integer, ForeignKey("repos.id", ondelete="CASCADE"), nullable=False, index=True)
-    kind = Column(String(100), nullable=False)  # 'checklist_ready', 'pr_validated', 'repo_event', etc.
-    payload = Column(JSON, nullable=True)  # JSONB
-    read = Column(Boolean, default=False, nullable=False, index=True)
+    kind = Column(InternedString(100), nullable=False)  # 'checklist_ready', 'pr_validated', 'repo_event', etc.
+    payload = Column(JSONB, nullable=True)
+    read = Column(Boolean, default=False, nullable=False)
     
     # Relationships
     user = relationship("User")
@@ -40,12 +45,16 @@ class Notification(Base, TimestampMixin):
 class AuditLog(Base, TimestampMixin):
     """Audit log model."""
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        Index("ix_audit_logs_target", "target_type", "target_id"),
+    )
     
+    id = Column(BigInteger, primary_key=True)
     actor_user_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
-    action = Column(String(100), nullable=False, index=True)  # 'flag_for_merge', 'regenerate_checklist', etc.
-    target_type = Column(String(50), nullable=False)  # 'pr', 'issue', 'repo', etc.
-    target_id = Column(Integer, nullable=False, index=True)
-    details = Column(JSON, nullable=True)  # JSONB
+    action = Column(InternedString(100), nullable=False, index=True)  # 'flag_for_merge', 'regenerate_checklist', etc.
+    target_type = Column(InternedString(50), nullable=False)  # 'pr', 'issue', 'repo', etc.
+    target_id = Column(BigInteger, nullable=False)
+    details = Column(JSONB, nullable=True)
     
     def __repr__(self):
         return f"<AuditLog(id={self.id}, action={self.action}, target_type={self.target_type}, target_id={self.target_id})>"
@@ -1,15 +1,66 @@
 """Base model for all database models."""
+import sys
 from datetime import datetime
-from sqlalchemy import Column, Integer, DateTime
+from sqlalchemy import DDL, Column, Integer, DateTime, FetchedValue, String, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
+from sqlalchemy.types import TypeDecorator
 
 Base = declarative_base()
 
 
+class InternedString(TypeDecorator):
+    """String column holding a small vocabulary of values.
+    
+    Loaded values are interned, so a bulk fetch shares one str per distinct
+    value instead of allocating one per row. Enum columns already return the
+    shared strings from their declared values.
+    """
+    impl = String
+    cache_ok = True
+    
+    def process_result_value(self, value, dialect):
+        return None if value is None else sys.intern(value)
+
+
 class TimestampMixin:
     """Mixin for created_at and updated_at timestamps."""
-    id = Column(Integer, primary_key=True, index=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    id = Column(Integer, primary_key=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.current_timestamp(), nullable=False)
+    # Maintained by the trg_touch_* BEFORE UPDATE triggers; eager_defaults
+    # reads the new value back via RETURNING so it never needs a lazy load.
+    updated_at = Column(DateTime(timezone=True), server_default=func.current_timestamp(), server_onupdate=FetchedValue(), nullable=False)
+    __mapper_args__ = {"eager_defaults": True}
+
+
+# Same function revision 004 installs on migrated databases
+_TOUCH_FUNCTION = DDL("""
+CREATE OR REPLACE FUNCTION _touch_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at = CURRENT_TIMESTAMP;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+""")
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_touch_triggers(metadata, connection, tables=(), **kw):
+    """Install the trg_touch_* triggers on tables built by metadata.create_all.
 
+    Migrated databases get them from revision 004; without them a schema
+    created straight from the models would never move updated_at. A table
+    can limit which column updates touch it via info["touch_columns"].
+    """
+    if connection.dialect.name != "postgresql":
+        return
+    connection.execute(_TOUCH_FUNCTION)
+    for table in tables:
+        if "updated_at" not in table.c:
+            continue
+        columns = table.info.get("touch_columns")
+        update_of = f" OF {', '.join(columns)}" if columns else ""
+        connection.execute(DDL(
+            f"CREATE TRIGGER trg_touch_{table.name} BEFORE UPDATE{update_of} ON {table.name} "
+            "FOR EACH ROW EXECUTE FUNCTION _touch_updated_at()"
+        ))
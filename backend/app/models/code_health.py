@@ -1,5 +1,6 @@
 """Code health model."""
-from sqlalchemy import Column, Integer, ForeignKey, JSON
+from sqlalchemy import Column, Integer, ForeignKey
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from app.models.base import Base, TimestampMixin
 
@@ -10,7 +11,7 @@ class CodeHealth(Base, TimestampMixin):
     
     pr_id = Column(Integer, ForeignKey("pull_requests.id", ondelete="CASCADE"), nullable=False, unique=True, index=True)
     score = Column(Integer, nullable=False)  # 0-100
-    findings = Column(JSON, nullable=True)  # JSONB array of findings
+    findings = Column(JSONB, nullable=True)  # Array of findings
     
     # Relationships
     pr = relationship("PullRequest", back_populates="code_health")
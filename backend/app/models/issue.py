@@ -1,23 +1,31 @@
 """Issue models."""
-from sqlalchemy import Column, String, Integer, ForeignKey, Text, JSON
+from sqlalchemy import Column, String, BigInteger, Boolean, Enum, Integer, ForeignKey, Text, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
-from app.models.base import Base, TimestampMixin
+from app.models.base import Base, InternedString, TimestampMixin
+
+ISSUE_STATUSES = ("pending", "processed", "needs_attention")
 
 
 class Issue(Base, TimestampMixin):
     """Issue model."""
     __tablename__ = "issues"
+    __table_args__ = (
+        Index("ix_issues_repo_created", "repo_id", text("created_at DESC"), postgresql_include=["status"]),
+        Index("ix_issues_repo_number", "repo_id", "issue_number", unique=True),
+    )
     
-    repo_id = Column(Integer, ForeignKey("repos.id", ondelete="CASCADE"), nullable=False, index=True)
-    issue_number = Column(Integer, nullable=False, index=True)
+    repo_id = Column(Integer, ForeignKey("repos.id", ondelete="CASCADE"), nullable=False)
+    issue_number = Column(Integer, nullable=False)
     title = Column(String(512), nullable=False)
     body = Column(Text, nullable=True)
-    checklist_json = Column(JSON, nullable=True)  # JSONB in PostgreSQL
-    status = Column(String(50), nullable=False, default="pending")  # 'pending', 'processed', 'needs_attention'
+    checklist_json = Column(JSONB, nullable=True)
+    status = Column(Enum(*ISSUE_STATUSES, name="issue_status"), nullable=False, default="pending")
     
-    # Relationships
+    # Relationships. checklist_items never lazy loads: an implicit load can't
+    # run under asyncio anyway, so callers must selectinload it explicitly.
     repo = relationship("Repo", back_populates="issues")
-    checklist_items = relationship("ChecklistItem", back_populates="issue", cascade="all, delete-orphan")
+    checklist_items = relationship("ChecklistItem", back_populates="issue", cascade="all, delete-orphan", lazy="raise_on_sql")
     
     def __repr__(self):
         return f"<Issue(id={self.id}, issue_number={self.issue_number}, repo_id={self.repo_id})>"
@@ -27,12 +35,13 @@ class ChecklistItem(Base, TimestampMixin):
     """Checklist item model."""
     __tablename__ = "checklist_items"
     
+    id = Column(BigInteger, primary_key=True)
     issue_id = Column(Integer, ForeignKey("issues.id", ondelete="CASCADE"), nullable=False, index=True)
     item_id = Column(String(50), nullable=False)  # C1, C2, etc.
     text = Column(Text, nullable=False)
-    required = Column(String(50), nullable=False, default="false")  # Store as string for JSON compatibility
-    status = Column(String(50), nullable=False, default="pending")  # 'pending', 'passed', 'failed', 'skipped'
-    linked_test_ids = Column(JSON, nullable=True)  # JSONB array of test IDs
+    required = Column(Boolean, nullable=False, default=False)
+    status = Column(InternedString(50), nullable=False, default="pending")  # 'pending', 'passed', 'failed', 'skipped'
+    linked_test_ids = Column(JSONB, nullable=True)  # Array of test IDs
     
     # Relationships
     issue = relationship("Issue", back_populates="checklist_items")
@@ -1,25 +1,33 @@
 """Pull request models."""
-from sqlalchemy import Column, String, Integer, ForeignKey, Text, JSON
+from sqlalchemy import Column, String, BigInteger, Enum, Integer, ForeignKey, Text, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from app.models.base import Base, TimestampMixin
 
+PR_VALIDATION_STATUSES = ("pending", "validated", "needs_work")
+TEST_RESULT_STATUSES = ("passed", "failed", "skipped")
+
 
 class PullRequest(Base, TimestampMixin):
     """Pull request model."""
     __tablename__ = "pull_requests"
+    __table_args__ = (
+        Index("ix_pull_requests_repo_created", "repo_id", text("created_at DESC"), postgresql_include=["validation_status"]),
+        Index("ix_pull_requests_repo_number", "repo_id", "pr_number", unique=True),
+    )
     
-    repo_id = Column(Integer, ForeignKey("repos.id", ondelete="CASCADE"), nullable=False, index=True)
-    pr_number = Column(Integer, nullable=False, index=True)
+    repo_id = Column(Integer, ForeignKey("repos.id", ondelete="CASCADE"), nullable=False)
+    pr_number = Column(Integer, nullable=False)
     head_sha = Column(String(40), nullable=True)  # Git SHA
     linked_issue_id = Column(Integer, ForeignKey("issues.id", ondelete="SET NULL"), nullable=True)
-    test_manifest = Column(JSON, nullable=True)  # JSONB
-    validation_status = Column(String(50), nullable=False, default="pending")  # 'pending', 'validated', 'needs_work'
+    test_manifest = Column(JSONB, nullable=True)
+    validation_status = Column(Enum(*PR_VALIDATION_STATUSES, name="pr_validation_status"), nullable=False, default="pending")
     
-    # Relationships
+    # Relationships. test_results/code_health never lazy load (see Issue)
     repo = relationship("Repo", back_populates="pull_requests")
     linked_issue = relationship("Issue", foreign_keys=[linked_issue_id])
-    test_results = relationship("TestResult", back_populates="pr", cascade="all, delete-orphan")
-    code_health = relationship("CodeHealth", back_populates="pr", cascade="all, delete-orphan", uselist=False)
+    test_results = relationship("TestResult", back_populates="pr", cascade="all, delete-orphan", lazy="raise_on_sql")
+    code_health = relationship("CodeHealth", back_populates="pr", cascade="all, delete-orphan", uselist=False, lazy="raise_on_sql")
     reports = relationship("Report", back_populates="pr", cascade="all, delete-orphan")
     
     def __repr__(self):
@@ -29,13 +37,17 @@ class PullRequest(Base, TimestampMixin):
 class TestResult(Base, TimestampMixin):
     """Test result model."""
     __tablename__ = "test_results"
+    __table_args__ = (
+        Index("ix_test_results_pr_test", "pr_id", "test_id", postgresql_include=["status"]),
+    )
     
-    pr_id = Column(Integer, ForeignKey("pull_requests.id", ondelete="CASCADE"), nullable=False, index=True)
-    test_id = Column(String(255), nullable=False, index=True)
+    id = Column(BigInteger, primary_key=True)
+    pr_id = Column(Integer, ForeignKey("pull_requests.id", ondelete="CASCADE"), nullable=False)
+    test_id = Column(String(255), nullable=False)
     name = Column(String(512), nullable=False)
-    status = Column(String(50), nullable=False)  # 'passed', 'failed', 'skipped'
+    status = Column(Enum(*TEST_RESULT_STATUSES, name="test_result_status"), nullable=False)
     log_url = Column(String(512), nullable=True)
-    checklist_ids = Column(JSON, nullable=True)  # JSONB array of checklist item IDs
+    checklist_ids = Column(JSONB, nullable=True)  # Array of checklist item IDs
     
     # Relationships
     pr = relationship("PullRequest", back_populates="test_results")
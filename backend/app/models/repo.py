@@ -1,7 +1,7 @@
 """Repository models."""
-from sqlalchemy import Column, String, BigInteger, Integer, ForeignKey, Boolean
+from sqlalchemy import DDL, Column, String, BigInteger, Integer, ForeignKey, Boolean, Index, Computed, event
 from sqlalchemy.orm import relationship
-from app.models.base import Base, TimestampMixin
+from app.models.base import Base, InternedString, TimestampMixin
 
 
 class Organization(Base, TimestampMixin):
@@ -21,10 +21,21 @@ class Organization(Base, TimestampMixin):
 class Repo(Base, TimestampMixin):
     """Repository model."""
     __tablename__ = "repos"
+    # The counter triggers only bump pr_count/issue_count, which should not
+    # move updated_at; see revision 010
+    __table_args__ = {
+        "info": {"touch_columns": ("repo_full_name", "installation_id", "is_installed", "owner_org_id")},
+    }
     
     repo_full_name = Column(String(512), unique=True, nullable=False, index=True)
+    # Derived from repo_full_name by the database on write
+    owner = Column(String(512), Computed("split_part(repo_full_name, '/', 1)", persisted=True))
+    name = Column(String(512), Computed("substr(repo_full_name, strpos(repo_full_name, '/') + 1)", persisted=True))
     installation_id = Column(BigInteger, nullable=True, index=True)
     is_installed = Column(Boolean, default=False, nullable=False)
+    # Maintained by database triggers on pull_requests/issues (revision 010)
+    pr_count = Column(Integer, nullable=False, server_default="0")
+    issue_count = Column(Integer, nullable=False, server_default="0")
     owner_org_id = Column(Integer, ForeignKey("organizations.id", ondelete="SET NULL"), nullable=True)
     
     # Relationships
@@ -38,13 +49,48 @@ class Repo(Base, TimestampMixin):
         return f"<Repo(id={self.id}, repo_full_name={self.repo_full_name})>"
 
 
+
+# (counted table, counter column on repos), as in revision 010
+_COUNTERS = (("pull_requests", "pr_count"), ("issues", "issue_count"))
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_count_triggers(metadata, connection, tables=(), **kw):
+    """Install revision 010's pr_count/issue_count triggers on create_all schemas."""
+    if connection.dialect.name != "postgresql":
+        return
+    created = {table.name for table in tables}
+    for table, column in _COUNTERS:
+        if table not in created:
+            continue
+        connection.execute(DDL(f"""
+CREATE OR REPLACE FUNCTION _count_{table}() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE repos SET {column} = {column} + 1 WHERE id = NEW.repo_id;
+    ELSE
+        UPDATE repos SET {column} = {column} - 1 WHERE id = OLD.repo_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""))
+        connection.execute(DDL(
+            f"CREATE TRIGGER trg_count_{table} AFTER INSERT OR DELETE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION _count_{table}()"
+        ))
+
 class UserRepoRole(Base, TimestampMixin):
     """User repository role model."""
     __tablename__ = "user_repo_roles"
+    __table_args__ = (
+        Index("ix_user_repo_roles_user_role", "user_id", "role", postgresql_include=["repo_id"]),
+        Index("ix_user_repo_roles_repo_role", "repo_id", "role", postgresql_include=["user_id"]),
+    )
     
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
-    repo_id = Column(Integer, ForeignKey("repos.id", ondelete="CASCADE"), nullable=False, index=True)
-    role = Column(String(50), nullable=False)  # 'admin', 'maintainer', 'viewer', 'manager'
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    repo_id = Column(Integer, ForeignKey("repos.id", ondelete="CASCADE"), nullable=False)
+    role = Column(InternedString(50), nullable=False)  # 'admin', 'maintainer', 'viewer', 'manager'
     
     # Relationships
     user = relationship("User", back_populates="repo_roles")
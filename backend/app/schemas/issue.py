@@ -1,18 +1,17 @@
 """Issue schemas."""
-from typing import List, Optional
-from pydantic import BaseModel
+from typing import List, Literal, Optional
+from pydantic import BaseModel, ConfigDict
 
 
 class ChecklistItemResponse(BaseModel):
     """Checklist item response schema."""
+    model_config = ConfigDict(from_attributes=True)
+    
     id: str
     text: str
     required: bool
     status: str  # 'pending', 'passed', 'failed', 'skipped'
     linked_tests: List[str] = []
-    
-    class Config:
-        from_attributes = True
 
 
 class ChecklistSummary(BaseModel):
@@ -25,15 +24,14 @@ class ChecklistSummary(BaseModel):
 
 class IssueResponse(BaseModel):
     """Issue response schema matching frontend TypeScript interface."""
+    model_config = ConfigDict(from_attributes=True)
+    
     issue_number: int
     title: str
-    status: str  # 'open', 'processing', 'completed'
+    status: Literal["open", "processing", "completed"]
     created_at: str
     updated_at: str
     checklist_summary: ChecklistSummary
     checklist: Optional[List[ChecklistItemResponse]] = None
     github_url: str
-    
-    class Config:
-        from_attributes = True
 
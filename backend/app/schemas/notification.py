@@ -1,17 +1,16 @@
 """Notification schemas."""
-from typing import Optional
-from pydantic import BaseModel
+from typing import Literal, Optional
+from pydantic import BaseModel, ConfigDict
 
 
 class NotificationResponse(BaseModel):
     """Notification response schema matching frontend TypeScript interface."""
+    model_config = ConfigDict(from_attributes=True)
+    
     id: str
-    type: str  # 'info', 'warning', 'error', 'success'
+    type: Literal["info", "warning", "error", "success"]
     message: str
     repo_full_name: Optional[str] = None
     created_at: str
     read: bool
-    
-    class Config:
-        from_attributes = True
 
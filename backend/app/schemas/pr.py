@@ -1,13 +1,15 @@
 """Pull request schemas."""
-from typing import List, Optional
-from pydantic import BaseModel
+from typing import List, Literal, Optional
+from pydantic import BaseModel, ConfigDict
+
+ValidationStatus = Literal["pending", "validated", "needs_work"]
 
 
 class TestResultResponse(BaseModel):
     """Test result response schema."""
     test_id: str
     name: str
-    status: str  # 'passed', 'failed', 'skipped'
+    status: Literal["passed", "failed", "skipped"]
     duration_ms: Optional[int] = None
     error_message: Optional[str] = None
     checklist_ids: List[str] = []
@@ -44,21 +46,20 @@ class CoverageAdviceResponse(BaseModel):
 
 class PRDetailResponse(BaseModel):
     """PR detail response schema matching frontend TypeScript interface."""
+    model_config = ConfigDict(from_attributes=True)
+    
     pr_number: int
     title: str
     author: str
     created_at: str
     health_score: int
-    validation_status: str  # 'pending', 'validated', 'needs_work'
+    validation_status: ValidationStatus
     manifest: Optional[dict] = None
     test_results: List[TestResultResponse] = []
     code_health: List[CodeHealthIssueResponse] = []
     coverage_advice: List[CoverageAdviceResponse] = []
     suggested_tests: List[SuggestedTestResponse] = []
     github_url: str
-    
-    class Config:
-        from_attributes = True
 
 
 class PRListItemResponse(BaseModel):
@@ -67,6 +68,6 @@ class PRListItemResponse(BaseModel):
     author: str
     created_at: str
     health_score: int
-    validation_status: str
+    validation_status: ValidationStatus
     github_url: str
 
@@ -1,10 +1,12 @@
 """Repository schemas."""
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class RepoSummaryResponse(BaseModel):
     """Repo summary response schema matching frontend TypeScript interface."""
+    model_config = ConfigDict(from_attributes=True)
+    
     repo_full_name: str
     owner: str
     name: str
@@ -17,7 +19,4 @@ class RepoSummaryResponse(BaseModel):
     recent_issue_numbers: list[int] = []
     stars: int = 0
     languages: list[str] = []
-    
-    class Config:
-        from_attributes = True
 
@@ -1,17 +1,16 @@
 """User schemas."""
 from typing import List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class UserResponse(BaseModel):
     """User response schema matching frontend TypeScript interface."""
+    model_config = ConfigDict(from_attributes=True)
+    
     id: str
     login: str
     avatar_url: str
     name: Optional[str] = None
     email: Optional[str] = None
     managed_repos: List[str] = []
-    
-    class Config:
-        from_attributes = True
 
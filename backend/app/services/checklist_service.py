@@ -1,13 +1,13 @@
 """Checklist generation service."""
 from typing import List, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select
 from app.models.repo import Repo
 from app.models.issue import Issue, ChecklistItem
-from app.models.repo import UserRepoRole
-from app.models.audit import Notification
 from app.utils.parser import extract_acceptance_criteria
-from app.services.github_auth import get_github_api_client_async
+from app.adapters.http import shared_http_client
+from app.services.github_auth import github_api_headers
+from app.services.repo_access import notify_managers
 from app.config import get_settings
 from app.logging_config import get_logger
 from datetime import datetime
@@ -77,26 +77,21 @@ async def generate_and_save_checklist(
     issue.checklist_json = checklist_data
     
     # Delete existing checklist items
-    await db.execute(
-        select(ChecklistItem).where(ChecklistItem.issue_id == issue.id)
-    )
-    existing_items = await db.execute(
-        select(ChecklistItem).where(ChecklistItem.issue_id == issue.id)
-    )
-    for item in existing_items.scalars():
-        await db.delete(item)
-    
-    # Create checklist items
-    for item_data in checklist_data:
-        checklist_item = ChecklistItem(
-            issue_id=issue.id,
-            item_id=item_data["id"],
-            text=item_data["text"],
-            required="true" if item_data.get("required", True) else "false",
-            status="pending",
-            linked_test_ids=[],
-        )
-        db.add(checklist_item)
+    await db.execute(delete(ChecklistItem).where(ChecklistItem.issue_id == issue.id))
+    
+    # Create checklist items in one batched INSERT
+    if checklist_data:
+        await db.execute(insert(ChecklistItem), [
+            {
+                "issue_id": issue.id,
+                "item_id": item_data["id"],
+                "text": item_data["text"],
+                "required": bool(item_data.get("required", True)),
+                "status": "pending",
+                "linked_test_ids": [],
+            }
+            for item_data in checklist_data
+        ])
     
     issue.status = "processed"
     await db.commit()
@@ -123,41 +118,26 @@ async def generate_and_save_checklist(
     # Post comment on GitHub (optional)
     if repo.installation_id and checklist_data:
         try:
-            client = await get_github_api_client_async(repo.installation_id)
+            headers = await github_api_headers(repo.installation_id)
             comment_body = "## Generated Checklist\n\n"
             for item in checklist_data:
                 required_marker = "✅" if item.get("required") else "⚪"
                 comment_body += f"{required_marker} {item['id']}: {item['text']}\n"
             
-            await client.post(
-                f"/repos/{repo_full_name}/issues/{issue_number}/comments",
+            await shared_http_client().post(
+                f"{settings.GITHUB_API_BASE}/repos/{repo_full_name}/issues/{issue_number}/comments",
                 json={"body": comment_body},
+                headers=headers,
             )
-            await client.aclose()
         except Exception as e:
             logger.warning(f"Failed to post checklist comment: {e}")
     
     # Create notifications for repo managers
-    managers_result = await db.execute(
-        select(UserRepoRole.user_id)
-        .where(UserRepoRole.repo_id == repo.id)
-        .where(UserRepoRole.role.in_(["admin", "maintainer", "manager"]))
-    )
-    manager_ids = [row[0] for row in managers_result.all()]
-    
-    for user_id in manager_ids:
-        notification = Notification(
-            user_id=user_id,
-            repo_id=repo.id,
-            kind="checklist_ready",
-            payload={
-                "issue_number": issue_number,
-                "issue_title": issue.title,
-                "checklist_count": len(checklist_data),
-            },
-            read=False,
-        )
-        db.add(notification)
+    await notify_managers(db, repo.id, "checklist_ready", {
+        "issue_number": issue_number,
+        "issue_title": issue.title,
+        "checklist_count": len(checklist_data),
+    })
     
     await db.commit()
 
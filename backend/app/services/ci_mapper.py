@@ -2,16 +2,15 @@
 import json
 from typing import Dict, Any, List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select
 from app.models.repo import Repo
-from app.models.pr import PullRequest
+from app.models.pr import PullRequest, TestResult
 from app.models.issue import ChecklistItem
-from app.models.test_result import TestResult
-from app.models.report import Report
-from app.models.audit import Notification
-from app.models.repo import UserRepoRole
+from app.models.audit import Report
 from app.utils.junit_parser import parse_junit_xml
-from app.services.github_auth import get_github_api_client_async
+from app.adapters.http import shared_http_client
+from app.services.github_auth import github_api_headers
+from app.services.repo_access import notify_managers
 from app.config import get_settings
 from app.logging_config import get_logger
 
@@ -63,33 +62,29 @@ async def process_and_map_results(
         logger.warning(f"PR not found for SHA {head_sha}")
         return
     
-    # Download artifacts
-    client = await get_github_api_client_async(repo.installation_id)
-    try:
-        # Get artifacts
-        artifacts_response = await client.get(
-            f"/repos/{repo_full_name}/actions/runs/{run_id}/artifacts"
-        )
-        artifacts_response.raise_for_status()
-        artifacts_data = artifacts_response.json()
-        
-        junit_content = None
-        coverage_content = None
-        
-        for artifact in artifacts_data.get("artifacts", []):
-            artifact_name = artifact.get("name", "")
-            
-            if artifact_name == "autoqa-test-report":
-                # Download artifact (would need to handle zip extraction in production)
-                # For now, log that artifact was found
-                logger.info(f"Found artifact: {artifact_name} (ID: {artifact.get('id')})")
-                # In production: download zip, extract, read XML file
-                # junit_content = extract_and_read_xml(artifact_zip)
+    # List the run's artifacts
+    artifacts_response = await shared_http_client().get(
+        f"{settings.GITHUB_API_BASE}/repos/{repo_full_name}/actions/runs/{run_id}/artifacts",
+        headers=await github_api_headers(repo.installation_id),
+    )
+    artifacts_response.raise_for_status()
+    artifacts_data = artifacts_response.json()
+    
+    junit_content = None
+    coverage_content = None
+    
+    for artifact in artifacts_data.get("artifacts", []):
+        artifact_name = artifact.get("name", "")
         
-        # For now, we'll need to fetch the actual artifact content
-        # This is simplified - in production, you'd need to handle zip extraction
-    finally:
-        await client.aclose()
+        if artifact_name == "autoqa-test-report":
+            # Download artifact (would need to handle zip extraction in production)
+            # For now, log that artifact was found
+            logger.info(f"Found artifact: {artifact_name} (ID: {artifact.get('id')})")
+            # In production: download zip, extract, read XML file
+            # junit_content = extract_and_read_xml(artifact_zip)
+    
+    # For now, we'll need to fetch the actual artifact content
+    # This is simplified - in production, you'd need to handle zip extraction
     
     # Parse JUnit XML (if available)
     if junit_content:
@@ -110,30 +105,24 @@ async def process_and_map_results(
     manifest_map = {test["test_id"]: test for test in manifest_tests}
     
     # Delete existing test results
-    existing_results = await db.execute(
-        select(TestResult).where(TestResult.pr_id == pr.id)
-    )
-    for result in existing_results.scalars():
-        await db.delete(result)
+    await db.execute(delete(TestResult).where(TestResult.pr_id == pr.id))
     
     # Create test results and map to checklist
     checklist_updates = {}  # item_id -> status
+    test_result_rows = []
     
     for test_data in test_results_data:
         test_id = test_data["test_id"]
         manifest_test = manifest_map.get(test_id, {})
         checklist_ids = manifest_test.get("checklist_ids", [])
         
-        # Create test result
-        test_result = TestResult(
-            pr_id=pr.id,
-            test_id=test_id,
-            name=test_data["name"],
-            status=test_data["status"],
-            duration_ms=test_data.get("duration_ms"),
-            checklist_ids=checklist_ids,
-        )
-        db.add(test_result)
+        test_result_rows.append({
+            "pr_id": pr.id,
+            "test_id": test_id,
+            "name": test_data["name"],
+            "status": test_data["status"],
+            "checklist_ids": checklist_ids,
+        })
         
         # Update checklist item statuses
         if test_data["status"] == "passed":
@@ -144,6 +133,10 @@ async def process_and_map_results(
             for item_id in checklist_ids:
                 checklist_updates[item_id] = "failed"
     
+    # Create test results in one batched INSERT
+    if test_result_rows:
+        await db.execute(insert(TestResult), test_result_rows)
+    
     # Update checklist items
     if pr.linked_issue_id:
         checklist_result = await db.execute(
@@ -173,26 +166,11 @@ async def process_and_map_results(
     logger.info(f"Processed workflow run {run_id} for PR #{pr.pr_number}")
     
     # Create notifications
-    managers_result = await db.execute(
-        select(UserRepoRole.user_id)
-        .where(UserRepoRole.repo_id == repo.id)
-        .where(UserRepoRole.role.in_(["admin", "maintainer", "manager"]))
-    )
-    manager_ids = [row[0] for row in managers_result.all()]
-    
-    for user_id in manager_ids:
-        notification = Notification(
-            user_id=user_id,
-            repo_id=repo.id,
-            kind="pr_validated",
-            payload={
-                "pr_number": pr.pr_number,
-                "validation_status": pr.validation_status,
-                "test_count": len(test_results_data),
-            },
-            read=False,
-        )
-        db.add(notification)
+    await notify_managers(db, repo.id, "pr_validated", {
+        "pr_number": pr.pr_number,
+        "validation_status": pr.validation_status,
+        "test_count": len(test_results_data),
+    })
     
     await db.commit()
 
@@ -11,6 +11,14 @@ from app.logging_config import get_logger
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Points deducted from the code health score per finding severity
+_SEVERITY_PENALTIES = {
+    "critical": 20,
+    "high": 10,
+    "medium": 5,
+    "low": 2,
+}
+
 
 async def process_code_health(
     pr_id: int,
@@ -38,19 +46,12 @@ async def process_code_health(
     findings = code_health_data.get("findings", [])
     
     # Compute score (0-100)
-    # Simple formula: start at 100, deduct points for issues
-    score = 100
-    severity_penalties = {
-        "critical": 20,
-        "high": 10,
-        "medium": 5,
-        "low": 2,
-    }
-    
-    for finding in findings:
-        severity = finding.get("severity", "low").lower()
-        penalty = severity_penalties.get(severity, 2)
-        score = max(0, score - penalty)
+    # Simple formula: start at 100, deduct points for issues. Penalties are
+    # non-negative, so clamping once at the end equals clamping per finding.
+    score = max(0, 100 - sum(
+        _SEVERITY_PENALTIES.get(finding.get("severity", "low").lower(), 2)
+        for finding in findings
+    ))
     
     # Get or create code health record
     health_result = await db.execute(
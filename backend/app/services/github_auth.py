@@ -1,10 +1,11 @@
 """GitHub App authentication and token management."""
 import time
 import jwt
-from datetime import datetime, timedelta
-from typing import Optional
+from datetime import datetime
+from typing import Dict, Optional, Tuple
 import httpx
 import redis.asyncio as aioredis
+from app.adapters.http import shared_http_client
 from app.config import get_settings
 from app.logging_config import get_logger
 
@@ -14,6 +15,17 @@ settings = get_settings()
 # Global Redis client (will be initialized)
 redis_client: Optional[aioredis.Redis] = None
 
+# Cached installation tokens expire this long before GitHub's expiry so
+# callers never receive a token that is about to lapse mid-request
+_TOKEN_REFRESH_MARGIN_SECONDS = 300
+
+# App JWT reused until this close to its exp; RS256 signing is the costly
+# part and the token is valid for GITHUB_APP_JWT_EXPIRATION_MINUTES
+_APP_JWT_REFRESH_MARGIN_SECONDS = 60
+
+# (token, exp) of the last app JWT signed by this process
+_app_jwt: Optional[Tuple[str, int]] = None
+
 
 async def init_redis() -> None:
     """Initialize Redis client."""
@@ -43,10 +55,16 @@ async def close_redis() -> None:
 def generate_app_jwt() -> str:
     """Generate JWT for GitHub App authentication.
     
+    The signed token is reused until shortly before it expires.
+    
     Returns:
         JWT token string
     """
+    global _app_jwt
     now = int(time.time())
+    if _app_jwt and _app_jwt[1] - now > _APP_JWT_REFRESH_MARGIN_SECONDS:
+        return _app_jwt[0]
+    
     payload = {
         "iat": now - 60,  # Issued at time (1 minute ago to account for clock skew)
         "exp": now + (settings.GITHUB_APP_JWT_EXPIRATION_MINUTES * 60),
@@ -59,6 +77,7 @@ def generate_app_jwt() -> str:
         algorithm="RS256"
     )
     
+    _app_jwt = (token, payload["exp"])
     return token
 
 
@@ -74,100 +93,69 @@ async def get_installation_token(installation_id: int) -> Optional[str]:
     await init_redis()
     
     cache_key = f"gh:install:{installation_id}:token"
-    cache_expiry_key = f"gh:install:{installation_id}:expires_at"
     
-    # Check cache
+    # Check cache. The key's TTL already ends before the token expires, so
+    # any hit is usable as is.
     if redis_client:
         try:
             cached_token = await redis_client.get(cache_key)
-            expires_at_str = await redis_client.get(cache_expiry_key)
-            
-            if cached_token and expires_at_str:
-                expires_at = datetime.fromisoformat(expires_at_str)
-                # Refresh if expires within 5 minutes
-                if expires_at > datetime.utcnow() + timedelta(minutes=5):
-                    logger.debug(f"Using cached installation token for {installation_id}")
-                    return cached_token
+            if cached_token:
+                logger.debug(f"Using cached installation token for {installation_id}")
+                return cached_token
         except Exception as e:
             logger.warning(f"Error reading from cache: {e}")
     
     # Generate new token
     app_jwt = generate_app_jwt()
     
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                f"{settings.GITHUB_API_BASE}/app/installations/{installation_id}/access_tokens",
-                headers={
-                    "Authorization": f"Bearer {app_jwt}",
-                    "Accept": "application/vnd.github+json",
-                },
-                timeout=10.0,
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            token = data["token"]
-            expires_at = datetime.fromisoformat(data["expires_at"].replace("Z", "+00:00"))
-            
-            # Cache the token
-            if redis_client:
-                try:
-                    ttl = int((expires_at - datetime.utcnow()).total_seconds())
-                    if ttl > 0:
-                        await redis_client.setex(cache_key, ttl, token)
-                        await redis_client.setex(cache_expiry_key, ttl, expires_at.isoformat())
-                except Exception as e:
-                    logger.warning(f"Error caching token: {e}")
-            
-            logger.info(f"Generated new installation token for {installation_id}")
-            return token
-            
-        except httpx.HTTPError as e:
-            logger.error(f"Failed to get installation token: {e}")
-            return None
+    client = shared_http_client()
+    try:
+        response = await client.post(
+            f"{settings.GITHUB_API_BASE}/app/installations/{installation_id}/access_tokens",
+            headers={
+                "Authorization": f"Bearer {app_jwt}",
+                "Accept": "application/vnd.github+json",
+            },
+            timeout=10.0,
+        )
+        response.raise_for_status()
+        data = response.json()
+        
+        token = data["token"]
+        expires_at = datetime.fromisoformat(data["expires_at"].replace("Z", "+00:00"))
+        
+        # Cache the token until shortly before it expires
+        if redis_client:
+            try:
+                ttl = min(
+                    int(expires_at.timestamp() - time.time()) - _TOKEN_REFRESH_MARGIN_SECONDS,
+                    settings.INSTALLATION_TOKEN_CACHE_TTL_SECONDS,
+                )
+                if ttl > 0:
+                    await redis_client.setex(cache_key, ttl, token)
+            except Exception as e:
+                logger.warning(f"Error caching token: {e}")
+        
+        logger.info(f"Generated new installation token for {installation_id}")
+        return token
+        
+    except httpx.HTTPError as e:
+        logger.error(f"Failed to get installation token: {e}")
+        return None
 
 
-def get_github_api_client(installation_id: Optional[int] = None) -> httpx.AsyncClient:
-    """Get authenticated GitHub API client (synchronous factory).
+async def github_api_headers(installation_id: Optional[int] = None) -> Dict[str, str]:
+    """Get headers authenticating a GitHub API request.
     
-    Note: For async usage, call get_installation_token first, then create client.
+    Send them with the shared HTTP client (app.adapters.http) so requests
+    reuse pooled connections.
     
     Args:
         installation_id: Optional installation ID. If provided, uses installation token.
                          Otherwise, uses app JWT.
     
     Returns:
-        Authenticated httpx client
-    """
-    if installation_id:
-        # Note: This is a sync function, token should be fetched separately
-        # For async usage, use get_installation_token_async pattern
-        app_jwt = generate_app_jwt()
-        auth_header = f"Bearer {app_jwt}"
-    else:
-        app_jwt = generate_app_jwt()
-        auth_header = f"Bearer {app_jwt}"
-    
-    return httpx.AsyncClient(
-        base_url=settings.GITHUB_API_BASE,
-        headers={
-            "Authorization": auth_header,
-            "Accept": "application/vnd.github+json",
-        },
-        timeout=30.0,
-    )
-
-
-async def get_github_api_client_async(installation_id: Optional[int] = None) -> httpx.AsyncClient:
-    """Get authenticated GitHub API client (async version).
-    
-    Args:
-        installation_id: Optional installation ID. If provided, uses installation token.
-                         Otherwise, uses app JWT.
-    
-    Returns:
-        Authenticated httpx client
+        Authorization and Accept headers
     """
     if installation_id:
         token = await get_installation_token(installation_id)
@@ -178,12 +166,7 @@ async def get_github_api_client_async(installation_id: Optional[int] = None) ->
         app_jwt = generate_app_jwt()
         auth_header = f"Bearer {app_jwt}"
     
-    return httpx.AsyncClient(
-        base_url=settings.GITHUB_API_BASE,
-        headers={
-            "Authorization": auth_header,
-            "Accept": "application/vnd.github+json",
-        },
-        timeout=30.0,
-    )
-
+    return {
+        "Authorization": auth_header,
+        "Accept": "application/vnd.github+json",
+    }
@@ -0,0 +1,96 @@
+"""Repo access service."""
+from typing import Any, Dict, List
+import orjson
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import false, insert, literal, select
+from app.models.audit import Notification
+from app.models.repo import Repo, UserRepoRole
+from app.services import github_auth
+from app.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+MANAGER_ROLES = ("admin", "maintainer", "manager")
+
+# Managed repos are read on every page load (/me) but role assignments
+# rarely change, so the list is cached briefly per user
+MANAGED_REPOS_CACHE_TTL = 60
+
+
+def _managed_repos_key(user_id: int) -> str:
+    return f"me:{user_id}:managed_repos"
+
+
+async def get_managed_repos(user_id: int, db: AsyncSession) -> List[str]:
+    """Get full names of repos the user manages.
+
+    Args:
+        user_id: User ID
+        db: Database session
+
+    Returns:
+        List of repo full names
+    """
+    redis_client = github_auth.redis_client
+    cache_key = _managed_repos_key(user_id)
+    if redis_client:
+        try:
+            cached = await redis_client.get(cache_key)
+            if cached is not None:
+                return orjson.loads(cached)
+        except Exception as e:
+            logger.warning(f"Error reading managed repos cache: {e}")
+
+    result = await db.execute(
+        select(Repo.repo_full_name)
+        .join(UserRepoRole)
+        .where(UserRepoRole.user_id == user_id)
+        .where(UserRepoRole.role.in_(MANAGER_ROLES))
+    )
+    managed_repos = list(result.scalars())
+
+    if redis_client:
+        try:
+            await redis_client.setex(cache_key, MANAGED_REPOS_CACHE_TTL, orjson.dumps(managed_repos))
+        except Exception as e:
+            logger.warning(f"Error caching managed repos: {e}")
+    return managed_repos
+
+
+async def invalidate_managed_repos(user_id: int) -> None:
+    """Drop the cached managed-repos list after the user's roles change."""
+    redis_client = github_auth.redis_client
+    if redis_client:
+        try:
+            await redis_client.delete(_managed_repos_key(user_id))
+        except Exception as e:
+            logger.warning(f"Error invalidating managed repos cache: {e}")
+
+
+async def notify_managers(db: AsyncSession, repo_id: int, kind: str, payload: Dict[str, Any]) -> None:
+    """Create a notification for every manager of a repo.
+
+    The fan-out runs server-side as a single INSERT ... SELECT over the
+    repo's manager roles.
+
+    Args:
+        db: Database session
+        repo_id: Repo ID
+        kind: Notification kind
+        payload: Notification payload, shared by every recipient
+    """
+    await db.execute(
+        insert(Notification).from_select(
+            ["user_id", "repo_id", "kind", "payload", "read"],
+            select(
+                UserRepoRole.user_id,
+                literal(repo_id),
+                literal(kind),
+                literal(payload, JSONB),
+                false(),
+            )
+            .where(UserRepoRole.repo_id == repo_id)
+            .where(UserRepoRole.role.in_(MANAGER_ROLES)),
+        )
+    )
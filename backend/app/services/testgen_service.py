@@ -1,18 +1,42 @@
 """Test manifest generation service."""
-from typing import Dict, Any, List
+import re
+from typing import Dict, Any, Iterable, List, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.models.repo import Repo
 from app.models.pr import PullRequest
 from app.models.issue import Issue, ChecklistItem
 from app.utils.parser import extract_changed_symbols
-from app.services.github_auth import get_github_api_client_async
+from app.adapters.http import shared_http_client
+from app.services.github_auth import github_api_headers
 from app.config import get_settings
 from app.logging_config import get_logger
 
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Checklist text is indexed by word so each symbol is a single dict lookup
+_WORD_RE = re.compile(r"\w+")
+
+
+def _index_checklist_words(items: Iterable[Tuple[str, str]]) -> Dict[str, List[str]]:
+    """Map each lowercased word of the checklist texts to the item ids using it.
+
+    Symbols are matched against whole words only, so "user" does not match
+    an item that only mentions "users".
+
+    Args:
+        items: (item_id, text) pairs
+
+    Returns:
+        Item ids per word, in checklist order
+    """
+    by_word: Dict[str, List[str]] = {}
+    for item_id, text in items:
+        for word in dict.fromkeys(_WORD_RE.findall(text.lower())):
+            by_word.setdefault(word, []).append(item_id)
+    return by_word
+
 
 async def generate_and_save_manifest(
     pr_payload: Dict[str, Any],
@@ -82,27 +106,26 @@ async def generate_and_save_manifest(
         pr.head_sha = head_sha
     
     # Fetch PR files from GitHub
-    client = await get_github_api_client_async(repo.installation_id)
-    try:
-        files_response = await client.get(
-            f"/repos/{repo_full_name}/pulls/{pr_number}/files"
-        )
-        files_response.raise_for_status()
-        files_data = files_response.json()
-    finally:
-        await client.aclose()
+    files_response = await shared_http_client().get(
+        f"{settings.GITHUB_API_BASE}/repos/{repo_full_name}/pulls/{pr_number}/files",
+        headers=await github_api_headers(repo.installation_id),
+    )
+    files_response.raise_for_status()
+    files_data = files_response.json()
     
     # Extract changed symbols and generate manifest
     manifest_tests = []
     test_id_counter = 1
     
-    # Get checklist items if linked issue exists
-    checklist_items = []
+    # Get checklist items if linked issue exists, indexed by lowercased word
+    # for the per-symbol matching below
+    checklist_by_word: Dict[str, List[str]] = {}
     if pr.linked_issue_id:
         checklist_result = await db.execute(
-            select(ChecklistItem).where(ChecklistItem.issue_id == pr.linked_issue_id)
+            select(ChecklistItem.item_id, ChecklistItem.text)
+            .where(ChecklistItem.issue_id == pr.linked_issue_id)
         )
-        checklist_items = checklist_result.scalars().all()
+        checklist_by_word = _index_checklist_words(checklist_result.all())
     
     for file_data in files_data:
         file_path = file_data.get("filename", "")
@@ -126,17 +149,15 @@ async def generate_and_save_manifest(
         # Generate test suggestions for each symbol
         for symbol in symbols:
             # Map to checklist items (simple heuristic)
-            checklist_ids = []
-            for item in checklist_items:
-                if symbol.lower() in item.text.lower():
-                    checklist_ids.append(item.item_id)
+            symbol_lower = symbol.lower()
+            checklist_ids = checklist_by_word.get(symbol_lower, [])
             
             test_id = f"T{test_id_counter}"
             test_id_counter += 1
             
             manifest_tests.append({
                 "test_id": test_id,
-                "name": f"test_{symbol.lower()}",
+                "name": f"test_{symbol_lower}",
                 "framework": framework,
                 "target_file": file_path,
                 "checklist_ids": checklist_ids,
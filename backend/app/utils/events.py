@@ -1,5 +1,5 @@
 """Utility functions for publishing SSE events."""
-import json
+import orjson
 import redis.asyncio as aioredis
 from app.config import get_settings
 from app.logging_config import get_logger
@@ -9,6 +9,11 @@ settings = get_settings()
 _redis_client: aioredis.Redis = None
 
 
+def _encode(event: dict) -> bytes:
+    """Serialize an event as the SSE dispatcher expects it (UTF-8 JSON)."""
+    return orjson.dumps(event, option=orjson.OPT_NON_STR_KEYS)
+
+
 async def get_redis_client() -> aioredis.Redis:
     """Get or create Redis client for pub/sub."""
     global _redis_client
@@ -37,7 +42,7 @@ async def publish_event(user_id: int, event_type: str, data: dict):
             "data": data,
             "timestamp": None  # Will be set by backend if needed
         }
-        await client.publish(channel, json.dumps(event))
+        await client.publish(channel, _encode(event))
         logger.debug(f"Published event to {channel}: {event_type}")
     except Exception as e:
         logger.error(f"Failed to publish event: {e}", exc_info=True)
@@ -63,7 +68,7 @@ async def publish_repo_event(repo_id: int, event_type: str, data: dict):
             "data": {**data, "repo_id": repo_id},
             "timestamp": None,
         }
-        await client.publish(channel, json.dumps(event))
+        await client.publish(channel, _encode(event))
         logger.debug(f"Published broadcast repo event {event_type} for repo {repo_id}")
     except Exception as e:
         logger.error(f"Failed to publish repo event: {e}", exc_info=True)
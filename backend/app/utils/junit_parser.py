@@ -60,16 +60,13 @@ def parse_junit_xml(xml_content: str) -> List[Dict[str, Any]]:
             status = "passed"
             error_message = None
             
-            if testcase.find("failure") is not None:
-                status = "failed"
-                failure = testcase.find("failure")
-                if failure is not None:
-                    error_message = failure.get("message", "") or failure.text or ""
-            elif testcase.find("error") is not None:
+            failure = testcase.find("failure")
+            if failure is None:
+                failure = testcase.find("error")
+            
+            if failure is not None:
                 status = "failed"
-                error = testcase.find("error")
-                if error is not None:
-                    error_message = error.get("message", "") or error.text or ""
+                error_message = failure.get("message", "") or failure.text or ""
             elif testcase.find("skipped") is not None:
                 status = "skipped"
             
@@ -2,6 +2,18 @@
 import re
 from typing import List, Dict, Any, Optional
 
+# Added lines declaring a symbol, per language (compiled once; the manifest
+# job runs them over every file of a PR)
+_PY_SYMBOL_RE = re.compile(r"^\s*\+.*?(?:def|class)\s+(\w+)", re.MULTILINE)
+_JS_SYMBOL_RES = tuple(
+    re.compile(pattern, re.MULTILINE)
+    for pattern in (
+        r"^\s*\+.*?(?:function|class)\s+(\w+)",
+        r"^\s*\+.*?(?:const|let|var)\s+(\w+)\s*=\s*(?:\(|function|class)",
+        r"^\s*\+.*?export\s+(?:function|class|const|let)\s+(\w+)",
+    )
+)
+
 
 def extract_acceptance_criteria(text: str) -> List[Dict[str, Any]]:
     """Extract acceptance criteria from issue body.
@@ -97,31 +109,21 @@ def extract_changed_symbols(diff_text: str, file_path: str) -> List[str]:
     Returns:
         List of symbol names
     """
-    symbols = []
-    
     # Determine language from file extension
     ext = file_path.split(".")[-1].lower()
     
-    if ext in ["py"]:
+    if ext == "py":
         # Python: look for def and class (allow leading spaces before '+')
-        pattern = r"^\s*\+.*?(?:def|class)\s+(\w+)"
-        matches = re.finditer(pattern, diff_text, re.MULTILINE)
-        for match in matches:
-            symbols.append(match.group(1))
-    
-    elif ext in ["js", "jsx", "ts", "tsx"]:
-        # JavaScript/TypeScript: look for function, class, const/let exports
-        patterns = [
-            r"^\s*\+.*?(?:function|class)\s+(\w+)",
-            r"^\s*\+.*?(?:const|let|var)\s+(\w+)\s*=\s*(?:\(|function|class)",
-            r"^\s*\+.*?export\s+(?:function|class|const|let)\s+(\w+)",
-        ]
-        for pattern in patterns:
-            matches = re.finditer(pattern, diff_text, re.MULTILINE)
-            for match in matches:
-                symbol = match.group(1)
-                if symbol not in symbols:
-                    symbols.append(symbol)
-    
-    return symbols
+        return [match.group(1) for match in _PY_SYMBOL_RE.finditer(diff_text)]
+    
+    if ext in ("js", "jsx", "ts", "tsx"):
+        # JavaScript/TypeScript: look for function, class, const/let exports;
+        # dict.fromkeys drops repeats while keeping first-seen order
+        return list(dict.fromkeys(
+            match.group(1)
+            for pattern in _JS_SYMBOL_RES
+            for match in pattern.finditer(diff_text)
+        ))
+    
+    return []
 
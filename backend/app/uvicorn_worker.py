@@ -0,0 +1,12 @@
+"""Gunicorn worker class for production deployments."""
+from uvicorn.workers import UvicornWorker
+
+
+class AppUvicornWorker(UvicornWorker):
+    """UvicornWorker pinned to uvloop and httptools.
+    
+    uvicorn's access log is off: RequestIDMiddleware and the application
+    logs already trace requests, so building the records would be wasted.
+    """
+    
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools", "access_log": False}
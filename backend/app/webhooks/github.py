@@ -6,6 +6,8 @@ from typing import Optional
 from fastapi import APIRouter, Request, HTTPException, Header, status
 from fastapi.responses import Response
 import redis.asyncio as aioredis
+from app.adapters.jobs import enqueue
+from app.utils.events import publish_repo_event
 from app.config import get_settings
 from app.logging_config import get_logger
 
@@ -97,21 +99,19 @@ async def github_webhook(
     x_github_event: Optional[str] = Header(None, alias="X-GitHub-Event"),
 ):
     """Handle GitHub webhook events."""
-    request_id = getattr(request.state, "request_id", "unknown")
-    
     # Get raw body
     body = await request.body()
     
     # Verify signature
     if not verify_webhook_signature(body, x_hub_signature_256 or ""):
-        logger.warning(f"Invalid webhook signature", extra={"request_id": request_id})
+        logger.warning(f"Invalid webhook signature")
         raise HTTPException(status_code=401, detail="Invalid signature")
     
     # Check for duplicate delivery
     if x_github_delivery and await is_duplicate_delivery(x_github_delivery):
         logger.info(
             f"Duplicate webhook delivery ignored",
-            extra={"request_id": request_id, "delivery_id": x_github_delivery}
+            extra={"delivery_id": x_github_delivery}
         )
         return Response(status_code=200, content="Duplicate delivery")
     
@@ -119,7 +119,7 @@ async def github_webhook(
     try:
         payload = json.loads(body.decode("utf-8"))
     except json.JSONDecodeError:
-        logger.error(f"Invalid JSON payload", extra={"request_id": request_id})
+        logger.error(f"Invalid JSON payload")
         raise HTTPException(status_code=400, detail="Invalid JSON")
     
     event_type = x_github_event or "unknown"
@@ -127,41 +127,32 @@ async def github_webhook(
     logger.info(
         f"Received webhook event: {event_type}",
         extra={
-            "request_id": request_id,
             "event_type": event_type,
             "delivery_id": x_github_delivery,
         }
     )
     
     # Enqueue background job based on event type
-    from rq import Queue
-    import redis
-    
-    redis_conn = redis.from_url(settings.REDIS_URL)
-    queue = Queue("default", connection=redis_conn)
-    
     # Route events to appropriate handlers
     if event_type == "installation":
         if payload.get("action") in ["created", "deleted"]:
             # Handle installation events
-            queue.enqueue("app.workers.tasks.handle_installation", payload)
+            await enqueue("app.workers.tasks.handle_installation", payload)
     
     elif event_type == "installation_repositories":
         if payload.get("action") in ["added", "removed"]:
             # Handle repository access changes
-            queue.enqueue("app.workers.tasks.handle_installation_repositories", payload)
+            await enqueue("app.workers.tasks.handle_installation_repositories", payload)
     
     elif event_type == "issues":
         if payload.get("action") in ["opened", "edited"]:
             # Generate checklist
-            from app.workers.tasks import generate_checklist
-            queue.enqueue(generate_checklist, payload)
+            await enqueue("app.workers.tasks.generate_checklist", payload)
             
             # Publish SSE event for real-time updates
             # TODO: Query users with access to this repo and publish events
             # For now, publish to all users (simplified)
             try:
-                from app.utils.events import publish_repo_event
                 repo = payload.get("repository", {})
                 repo_id = repo.get("id")  # GitHub repo ID, not our DB ID
                 await publish_repo_event(repo_id, "issue_updated", {
@@ -175,21 +166,19 @@ async def github_webhook(
     elif event_type == "pull_request":
         if payload.get("action") in ["opened", "synchronize"]:
             # Generate test manifest
-            from app.workers.tasks import generate_test_manifest
-            queue.enqueue(generate_test_manifest, payload)
+            await enqueue("app.workers.tasks.generate_test_manifest", payload)
         elif payload.get("action") == "closed":
             # Handle PR closure
-            queue.enqueue("app.workers.tasks.handle_pr_closed", payload)
+            await enqueue("app.workers.tasks.handle_pr_closed", payload)
     
     elif event_type == "workflow_run":
         if payload.get("action") == "completed":
             # Process workflow run
-            from app.workers.tasks import process_workflow_run
-            queue.enqueue(process_workflow_run, payload)
+            await enqueue("app.workers.tasks.process_workflow_run", payload)
     
     elif event_type in ["check_suite", "check_run"]:
         # Handle check events if needed
-        logger.debug(f"Check event received: {event_type}", extra={"request_id": request_id})
+        logger.debug(f"Check event received: {event_type}")
     
     # Return 200 quickly
     return Response(status_code=200, content="OK")
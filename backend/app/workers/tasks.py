@@ -1,8 +1,12 @@
 """Background job tasks for RQ."""
-from typing import Dict, Any
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Dict, Any
+import orjson
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from app.config import get_settings
-from app.adapters.db import get_db
+from app.adapters.db import get_db, json_dumps
+from app.adapters.http import close_http_client, shared_http_client
 from app.services.checklist_service import generate_and_save_checklist
 from app.logging_config import get_logger
 
@@ -10,22 +14,44 @@ logger = get_logger(__name__)
 settings = get_settings()
 
 # Create database session for workers
-engine = create_async_engine(settings.DATABASE_URL)
+engine = create_async_engine(
+    settings.database_url_async,
+    json_serializer=json_dumps,
+    json_deserializer=orjson.loads,
+)
 async_session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+# Range-partitioned tables maintained by ensure_partitions, and how often it runs
+_PARTITIONED_TABLES = ("notifications", "audit_logs")
+_PARTITION_RUN_INTERVAL = timedelta(days=1)
+
 
 async def get_db_session() -> AsyncSession:
     """Get database session for worker."""
     return async_session_maker()
 
 
+def _run_job(job: Awaitable[None]) -> None:
+    """Run a job coroutine on a fresh event loop.
+    
+    The shared HTTP client is bound to the loop, so it is closed before
+    asyncio.run tears the loop down.
+    """
+    async def _main() -> None:
+        try:
+            await job
+        finally:
+            await close_http_client()
+    
+    asyncio.run(_main())
+
+
 def generate_checklist(issue_payload: Dict[str, Any]) -> None:
     """Generate checklist for an issue (RQ task).
     
     Args:
         issue_payload: GitHub webhook payload for issue event
     """
-    import asyncio
     
     async def _generate():
         db = await get_db_session()
@@ -39,7 +65,7 @@ def generate_checklist(issue_payload: Dict[str, Any]) -> None:
         finally:
             await db.close()
     
-    asyncio.run(_generate())
+    _run_job(_generate())
 
 
 def generate_test_manifest(pr_payload: Dict[str, Any]) -> None:
@@ -48,7 +74,6 @@ def generate_test_manifest(pr_payload: Dict[str, Any]) -> None:
     Args:
         pr_payload: GitHub webhook payload for PR event
     """
-    import asyncio
     
     async def _generate():
         db = await get_db_session()
@@ -63,7 +88,7 @@ def generate_test_manifest(pr_payload: Dict[str, Any]) -> None:
         finally:
             await db.close()
     
-    asyncio.run(_generate())
+    _run_job(_generate())
 
 
 def process_workflow_run(workflow_run_payload: Dict[str, Any]) -> None:
@@ -72,7 +97,6 @@ def process_workflow_run(workflow_run_payload: Dict[str, Any]) -> None:
     Args:
         workflow_run_payload: GitHub webhook payload for workflow_run event
     """
-    import asyncio
     
     async def _process():
         db = await get_db_session()
@@ -87,7 +111,7 @@ def process_workflow_run(workflow_run_payload: Dict[str, Any]) -> None:
         finally:
             await db.close()
     
-    asyncio.run(_process())
+    _run_job(_process())
 
 
 def handle_installation(installation_payload: Dict[str, Any]) -> None:
@@ -96,48 +120,42 @@ def handle_installation(installation_payload: Dict[str, Any]) -> None:
     Args:
         installation_payload: GitHub webhook payload for installation event
     """
-    import asyncio
     
     async def _handle():
         db = await get_db_session()
         try:
-                from app.services.github_auth import get_github_api_client_async
+                from app.integrations.github.client import list_installation_repositories
                 installation_data = installation_payload.get("installation", {})
                 installation_id = installation_data.get("id")
                 
                 if installation_payload.get("action") == "created":
                     # Fetch repositories for this installation
-                    client = await get_github_api_client_async(installation_id)
-                    try:
-                        repos_response = await client.get("/installation/repositories")
-                        repos_data = repos_response.json()
-                        
-                        # Create/update repos in database
-                        from app.models.repo import Repo
-                        from sqlalchemy import select
+                    repos_data = await list_installation_repositories(shared_http_client(), installation_id)
+                    
+                    # Create/update repos in database
+                    from app.models.repo import Repo
+                    from sqlalchemy import select
+                    
+                    for repo_data in repos_data.get("repositories", []):
+                        repo_full_name = repo_data["full_name"]
+                        result = await db.execute(
+                            select(Repo).where(Repo.repo_full_name == repo_full_name)
+                        )
+                        repo = result.scalar_one_or_none()
                         
-                        for repo_data in repos_data.get("repositories", []):
-                            repo_full_name = repo_data["full_name"]
-                            result = await db.execute(
-                                select(Repo).where(Repo.repo_full_name == repo_full_name)
+                        if repo:
+                            repo.installation_id = installation_id
+                            repo.is_installed = True
+                        else:
+                            repo = Repo(
+                                repo_full_name=repo_full_name,
+                                installation_id=installation_id,
+                                is_installed=True,
                             )
-                            repo = result.scalar_one_or_none()
-                            
-                            if repo:
-                                repo.installation_id = installation_id
-                                repo.is_installed = True
-                            else:
-                                repo = Repo(
-                                    repo_full_name=repo_full_name,
-                                    installation_id=installation_id,
-                                    is_installed=True,
-                                )
-                                db.add(repo)
-                        
-                        await db.commit()
-                        logger.info(f"Updated repos for installation {installation_id}")
-                    finally:
-                        await client.aclose()
+                            db.add(repo)
+                    
+                    await db.commit()
+                    logger.info(f"Updated repos for installation {installation_id}")
                 
                 elif installation_payload.get("action") == "deleted":
                     # Mark repos as uninstalled
@@ -159,7 +177,7 @@ def handle_installation(installation_payload: Dict[str, Any]) -> None:
         finally:
             await db.close()
     
-    asyncio.run(_handle())
+    _run_job(_handle())
 
 
 def handle_installation_repositories(repositories_payload: Dict[str, Any]) -> None:
@@ -184,7 +202,6 @@ def handle_pr_closed(pr_payload: Dict[str, Any]) -> None:
 
 def refresh_repository(payload: Dict[str, Any]) -> None:
     """Refresh repository metadata and recent activity (RQ task)."""
-    import asyncio
 
     async def _refresh():
         db = await get_db_session()
@@ -199,12 +216,11 @@ def refresh_repository(payload: Dict[str, Any]) -> None:
                 return
             # Optionally fetch latest metadata via GitHub API if installed
             if repo.is_installed and repo.installation_id:
-                from app.services.github_auth import get_github_api_client_async
-                client = await get_github_api_client_async(repo.installation_id)
-                try:
-                    await client.get(f"/repos/{repo_full_name}")
-                finally:
-                    await client.aclose()
+                from app.services.github_auth import github_api_headers
+                await shared_http_client().get(
+                    f"{settings.GITHUB_API_BASE}/repos/{repo_full_name}",
+                    headers=await github_api_headers(repo.installation_id),
+                )
             await db.commit()
             logger.info(f"Refreshed repo {repo_full_name}")
         except Exception as e:
@@ -214,5 +230,68 @@ def refresh_repository(payload: Dict[str, Any]) -> None:
         finally:
             await db.close()
 
-    asyncio.run(_refresh())
+    _run_job(_refresh())
+
+
+
+def ensure_partitions(months_ahead: int = 3) -> None:
+    """Create upcoming monthly partitions for partitioned tables (RQ task).
+
+    Enqueued whenever a worker starts and then reschedules itself daily, so
+    the partition window keeps rolling forward; safe to run repeatedly.
+    Tables that were never converted to partitioned tables are skipped.
+
+    Args:
+        months_ahead: Number of months past the current one to provision
+    """
+    from sqlalchemy import text
+
+    async def _ensure():
+        db = await get_db_session()
+        try:
+            result = await db.execute(
+                text(
+                    "SELECT t FROM unnest(CAST(:tables AS text[])) AS t "
+                    "JOIN pg_class c ON c.oid = to_regclass(t) WHERE c.relkind = 'p'"
+                ),
+                {"tables": list(_PARTITIONED_TABLES)},
+            )
+            partitioned = result.scalars().all()
+            for table in set(_PARTITIONED_TABLES).difference(partitioned):
+                logger.info(f"Skipping partition maintenance for unpartitioned table {table}")
+            for table in partitioned:
+                await db.execute(
+                    text("SELECT create_monthly_partitions(:table, :months)"),
+                    {"table": table, "months": months_ahead},
+                )
+            await db.commit()
+            logger.info(f"Ensured partitions {months_ahead} months ahead")
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"Error ensuring partitions: {e}", exc_info=True)
+            raise
+        finally:
+            await db.close()
+
+    try:
+        _run_job(_ensure())
+    finally:
+        _schedule_next_partition_run(months_ahead)
+
+
+def _schedule_next_partition_run(months_ahead: int) -> None:
+    """Schedule the next ensure_partitions run on the RQ scheduler.
+
+    The job id is keyed on the run date, so the runs enqueued by several
+    worker boots collapse into one scheduled job per day, and the id never
+    matches the job currently executing.
+    """
+    from app.adapters.jobs import get_queue
 
+    run_at = datetime.now(timezone.utc) + _PARTITION_RUN_INTERVAL
+    get_queue().enqueue_at(
+        run_at,
+        ensure_partitions,
+        months_ahead,
+        job_id=f"ensure_partitions:{run_at.date().isoformat()}",
+    )
@@ -1,6 +1,7 @@
 """RQ worker entrypoint."""
 from rq import Worker, Queue, Connection
 import redis
+from app.adapters.jobs import OrjsonSerializer
 from app.config import get_settings
 
 settings = get_settings()
@@ -9,6 +10,11 @@ if __name__ == "__main__":
     redis_conn = redis.from_url(settings.REDIS_URL)
     
     with Connection(redis_conn):
-        worker = Worker(["default"])
-        worker.work()
+        # Roll monthly partitions forward on every worker boot;
+        # ensure_partitions then reschedules itself daily
+        queue = Queue("default", serializer=OrjsonSerializer)
+        queue.enqueue("app.workers.tasks.ensure_partitions")
+        worker = Worker(["default"], serializer=OrjsonSerializer)
+        # The built-in scheduler moves enqueue_at jobs onto the queue when due
+        worker.work(with_scheduler=True)
 
@@ -22,14 +22,9 @@ async def create_all_tables():
         
         settings = get_settings()
         
-        # Create engine and normalize DATABASE_URL
-        db_url = settings.DATABASE_URL
-        if isinstance(db_url, str):
-            db_url = db_url.strip('\"\'')
-        
         print(f"Creating tables in database...")
         
-        async_engine = create_async_engine(db_url, echo=False)
+        async_engine = create_async_engine(settings.database_url_async, echo=False)
         
         async with async_engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
@@ -15,7 +15,7 @@ sys.path.insert(0, str(ROOT))
 
 from app.config import get_settings
 from app.logging_config import get_logger
-from app.adapters.db import init_db, async_session_maker
+from app.adapters.db import init_db, _session_factory
 from app.adapters.mongo import init_mongo, get_collection, close_mongo
 from sqlalchemy import select
 from app.models.issue import Issue
@@ -34,7 +34,7 @@ async def migrate():
     coll = get_collection("checklists")
     migrated = 0
 
-    async with async_session_maker() as session:
+    async with _session_factory()() as session:
         result = await session.execute(select(Issue))
         for issue in result.scalars():
             checklist = getattr(issue, "checklist_json", None)
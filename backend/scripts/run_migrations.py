@@ -29,10 +29,10 @@ def run_migrations():
         
         # Set the sqlalchemy.url from environment or config
         # This ensures migrations use the correct DATABASE_URL
-        from app.config import settings
+        from app.config import get_settings
         
-        # Get the database URL and normalize it
-        db_url = settings.database_url_sync
+        # Settings already normalize the URL for the sync driver
+        db_url = get_settings().database_url_sync
         if not db_url:
             print("ERROR: DATABASE_URL not set in environment or config")
             return False
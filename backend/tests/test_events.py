@@ -0,0 +1,154 @@
+"""Tests for the shared SSE dispatcher and per-stream queues."""
+import asyncio
+import orjson
+import pytest
+from app.api import events
+
+
+class FakePubSub:
+    """Pub/sub stand-in whose listen() yields messages put on a queue."""
+
+    def __init__(self):
+        self.messages: asyncio.Queue = asyncio.Queue()
+        self.patterns = []
+        self.channels = []
+        self.closed = False
+
+    async def psubscribe(self, pattern):
+        self.patterns.append(pattern)
+
+    async def subscribe(self, channel):
+        self.channels.append(channel)
+
+    async def listen(self):
+        while True:
+            yield await self.messages.get()
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeRedis:
+    def __init__(self):
+        self.pubsub_instance = FakePubSub()
+        self.closed = False
+        self.closed_after_pubsub = False
+
+    def pubsub(self):
+        return self.pubsub_instance
+
+    async def close(self):
+        self.closed = True
+        self.closed_after_pubsub = self.pubsub_instance.closed
+
+
+@pytest.fixture
+async def redis(monkeypatch):
+    client = FakeRedis()
+    monkeypatch.setattr(events, "redis_pubsub", client)
+    monkeypatch.setattr(events, "_dispatch_task", None)
+    monkeypatch.setattr(events, "_SUBSCRIBERS", {})
+    yield client
+    await events.close_redis_pubsub()
+
+
+def _stream(user_id: int, maxsize: int = events.MAX_QUEUED_FRAMES) -> asyncio.Queue:
+    queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+    events._SUBSCRIBERS.setdefault(user_id, set()).add(queue)
+    return queue
+
+
+def _drain(queue: asyncio.Queue) -> list:
+    return [queue.get_nowait() for _ in range(queue.qsize())]
+
+
+async def test_dispatch_routes_user_and_broadcast_messages(redis):
+    """User messages reach only that user's streams; broadcasts reach every stream."""
+    first, second, other = _stream(1), _stream(1), _stream(2)
+    pubsub = redis.pubsub_instance
+    events._ensure_dispatcher()
+
+    await pubsub.messages.put({"type": "psubscribe", "channel": b"user:*:events", "data": 1})
+    await pubsub.messages.put({"type": "pmessage", "channel": b"user:1:events", "data": b'{"n":1}'})
+    await pubsub.messages.put({"type": "pmessage", "channel": b"user:2:events", "data": b"not json"})
+    await pubsub.messages.put({"type": "message", "channel": b"broadcast:events", "data": b'{"n":2}'})
+    while not pubsub.messages.empty():
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert pubsub.patterns == [events.USER_CHANNEL_PATTERN]
+    assert pubsub.channels == [events.BROADCAST_CHANNEL]
+    user_frame = b"data: " + orjson.dumps({"n": 1}) + b"\n\n"
+    broadcast_frame = b"data: " + orjson.dumps({"n": 2}) + b"\n\n"
+    assert _drain(first) == [user_frame, broadcast_frame]
+    assert _drain(second) == [user_frame, broadcast_frame]
+    assert _drain(other) == [broadcast_frame]
+
+
+async def test_close_waits_for_dispatcher_before_closing_client(redis):
+    """The subscription is closed by the cancelled dispatcher before the client."""
+    events._ensure_dispatcher()
+    task = events._dispatch_task
+    await asyncio.sleep(0)
+
+    await events.close_redis_pubsub()
+
+    assert task.done()
+    assert redis.closed and redis.closed_after_pubsub
+    assert events._dispatch_task is None
+    assert events.redis_pubsub is None
+
+
+async def test_deliver_drops_streams_that_fall_behind(redis):
+    """A full queue is unsubscribed, emptied and ended with the close sentinel."""
+    slow = _stream(1, maxsize=2)
+    events._deliver(1, slow, b"a")
+    events._deliver(1, slow, b"b")
+
+    events._deliver(1, slow, b"c")
+
+    assert 1 not in events._SUBSCRIBERS
+    assert _drain(slow) == [None]
+
+
+def test_close_stream_keeps_unread_frames_when_there_is_room():
+    queue: asyncio.Queue = asyncio.Queue(maxsize=3)
+    queue.put_nowait(b"a")
+
+    events._close_stream(queue)
+
+    assert _drain(queue) == [b"a", None]
+
+
+async def test_collect_batch_gathers_queued_frames_up_to_the_limit():
+    queue: asyncio.Queue = asyncio.Queue()
+    for i in range(events.MAX_BATCH_FRAMES + 2):
+        queue.put_nowait(b"%d" % i)
+
+    frames, closed = await events._collect_batch(queue, b"first")
+
+    assert frames == [b"first"] + [b"%d" % i for i in range(events.MAX_BATCH_FRAMES - 1)]
+    assert not closed
+    assert queue.qsize() == 3
+
+
+async def test_collect_batch_waits_briefly_for_more_frames():
+    queue: asyncio.Queue = asyncio.Queue()
+    asyncio.get_running_loop().call_later(events.MAX_BATCH_DELAY / 5, queue.put_nowait, b"late")
+
+    frames, closed = await events._collect_batch(queue, b"first")
+
+    assert frames == [b"first", b"late"]
+    assert not closed
+
+
+async def test_collect_batch_stops_at_close_sentinel():
+    queue: asyncio.Queue = asyncio.Queue()
+    queue.put_nowait(b"a")
+    queue.put_nowait(None)
+    queue.put_nowait(b"after")
+
+    frames, closed = await events._collect_batch(queue, b"first")
+
+    assert frames == [b"first", b"a"]
+    assert closed
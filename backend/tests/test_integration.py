@@ -64,8 +64,8 @@ async def test_webhook_issue_opened_creates_checklist():
         items = list(items_result.scalars().all())
         assert len(items) == 3
         assert items[0].item_id == "C1"
-        assert items[1].required == "false"  # Optional item
-        assert items[2].required == "true"
+        assert items[1].required is False  # Optional item
+        assert items[2].required is True
     
     await engine.dispose()
 
@@ -1,7 +1,14 @@
 """Integration test for authentication endpoints."""
+import base64
+import hashlib
+import hmac
+import json
+import time
+import jwt
 import pytest
 from httpx import AsyncClient
 from app.main import app
+from app.api.auth import _decode_session_token, create_session_token, get_user_from_token
 from app.config import get_settings
 
 settings = get_settings()
@@ -54,3 +61,54 @@ async def test_me_endpoint_with_invalid_token():
         )
         assert response.status_code == 401  # Unauthorized
 
+
+
+def _forge(header: dict, claims: dict) -> str:
+    """Build an HS256-signed token with an arbitrary header."""
+    def b64(data: bytes) -> str:
+        return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+    signing_input = f"{b64(json.dumps(header).encode())}.{b64(json.dumps(claims).encode())}"
+    signature = hmac.new(settings.JWT_SECRET.encode(), signing_input.encode(), hashlib.sha256).digest()
+    return f"{signing_input}.{b64(signature)}"
+
+
+def test_session_token_round_trips_with_pyjwt():
+    """Session tokens stay interchangeable with PyJWT HS256 tokens."""
+    token = create_session_token(42)
+    assert jwt.decode(token, settings.JWT_SECRET, algorithms=["HS256"])["user_id"] == 42
+
+    pyjwt_token = jwt.encode(
+        {"user_id": 7, "exp": int(time.time()) + 60}, settings.JWT_SECRET, algorithm="HS256"
+    )
+    assert get_user_from_token(pyjwt_token) == 7
+
+
+def test_session_token_rejects_tampered_signature():
+    """Test that a token with a modified signature is rejected."""
+    header, payload, signature = create_session_token(42).split(".")
+    flipped = ("B" if signature[0] == "A" else "A") + signature[1:]
+    assert _decode_session_token(f"{header}.{payload}.{flipped}") is None
+
+
+def test_session_token_rejects_other_algorithms():
+    """Test that only HS256 headers are accepted, even with a valid signature."""
+    claims = {"user_id": 42, "exp": int(time.time()) + 60}
+    assert _decode_session_token(_forge({"alg": "HS256", "typ": "JWT"}, claims)) == claims
+    assert _decode_session_token(_forge({"alg": "none", "typ": "JWT"}, claims)) is None
+    assert _decode_session_token(_forge({"alg": "HS512", "typ": "JWT"}, claims)) is None
+
+
+def test_session_token_rejects_expired():
+    """Test that a correctly signed but expired token is rejected."""
+    token = jwt.encode(
+        {"user_id": 42, "exp": int(time.time()) - 1}, settings.JWT_SECRET, algorithm="HS256"
+    )
+    assert _decode_session_token(token) is None
+    assert get_user_from_token(token) is None
+
+
+def test_session_token_rejects_non_ascii():
+    """Test that non-ASCII input is rejected instead of raising."""
+    assert _decode_session_token("é.é.é") is None
+    assert get_user_from_token("ünï.cö.dé") is None
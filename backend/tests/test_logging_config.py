@@ -0,0 +1,51 @@
+"""Tests for the JSON log formatter."""
+import logging
+import orjson
+from app.logging_config import JSONFormatter
+
+
+def _record(msg="hello", args=(), created=None, **extra):
+    record = logging.LogRecord("app.test", logging.INFO, __file__, 10, msg, args, None)
+    record.request_id = "req-1"
+    if created is not None:
+        record.created = created
+    record.__dict__.update(extra)
+    return record
+
+
+def test_format_emits_extras_as_top_level_fields():
+    """extra= values become fields; non-str keys and unknown types are stringified."""
+    record = _record("user %s", ("alice",), pr_id=7, counts={1: "a", None: "b"}, path=object)
+
+    data = orjson.loads(JSONFormatter().format(record))
+
+    assert data["message"] == "user alice"
+    assert data["request_id"] == "req-1"
+    assert data["pr_id"] == 7
+    assert data["counts"] == {"1": "a", "null": "b"}
+    assert data["path"] == str(object)
+    assert "args" not in data and "msg" not in data
+
+
+def test_format_handles_ints_wider_than_64_bits():
+    """Values orjson rejects still produce a line instead of a dropped record."""
+    data = orjson.loads(JSONFormatter().format(_record(github_id=2**70, counts={1: 2})))
+
+    assert data["github_id"] == 2**70
+    assert data["counts"] == {"1": 2}
+
+
+def test_timestamp_reuses_the_formatted_second():
+    """Records within one second share the cached prefix; a new second refreshes it."""
+    formatter = JSONFormatter()
+
+    first = orjson.loads(formatter.format(_record(created=0.25)))["timestamp"]
+    assert first == "1970-01-01T00:00:00.250000Z"
+    assert formatter._second_cache == (0, "1970-01-01T00:00:00")
+
+    second = orjson.loads(formatter.format(_record(created=0.5)))["timestamp"]
+    assert second == "1970-01-01T00:00:00.500000Z"
+
+    later = orjson.loads(formatter.format(_record(created=61.125)))["timestamp"]
+    assert later == "1970-01-01T00:01:01.125000Z"
+    assert formatter._second_cache == (61, "1970-01-01T00:01:01")
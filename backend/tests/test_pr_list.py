@@ -0,0 +1,44 @@
+"""Tests for the PR list query and response items."""
+from datetime import datetime, timezone
+from sqlalchemy.dialects import postgresql
+from app.api.routes import _pr_list_item, _pr_list_query
+from app.models.code_health import CodeHealth
+from app.models.pr import PullRequest
+
+
+def _sql(query) -> str:
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+def test_health_sort_orders_by_joined_code_health_score():
+    """sort=health orders by code_health.score over an outer join, unscored PRs last."""
+    sql = _sql(_pr_list_query(1, None, None, "health", "desc"))
+
+    assert "LEFT OUTER JOIN code_health ON code_health.pr_id = pull_requests.id" in sql
+    assert "ORDER BY code_health.score DESC NULLS LAST" in sql
+    assert "code_health.score" in sql.split("FROM")[0]
+
+
+def test_filters_match_status_and_displayed_title():
+    """q matches the "PR #<number>" title the list shows; status filters exactly."""
+    sql = _sql(_pr_list_query(1, "validated", "12", "updated", "asc"))
+
+    assert "pull_requests.validation_status = " in sql
+    assert "concat(" in sql and "ILIKE" in sql
+    assert "ORDER BY pull_requests.updated_at ASC" in sql
+
+
+def test_list_item_uses_code_health_score():
+    """Items carry the joined score, or 0 for PRs without code health."""
+    created = datetime(2026, 1, 2, tzinfo=timezone.utc)
+    scored = PullRequest(pr_number=7, validation_status="validated", created_at=created)
+    scored.code_health = CodeHealth(score=91)
+    unscored = PullRequest(pr_number=8, validation_status="pending", created_at=created)
+    unscored.code_health = None
+
+    items = [_pr_list_item(pr, "https://github.com/o/r/pull/") for pr in (scored, unscored)]
+
+    assert [item.title for item in items] == ["PR #7", "PR #8"]
+    assert [item.author for item in items] == ["unknown", "unknown"]
+    assert [item.health_score for item in items] == [91, 0]
+    assert items[0].github_url == "https://github.com/o/r/pull/7"
@@ -0,0 +1,63 @@
+"""Tests for the Redis sliding-window rate limiter."""
+import pytest
+import redis.asyncio as aioredis
+from httpx import AsyncClient
+from starlette.responses import PlainTextResponse
+from app.config import get_settings
+from app.middleware.rate_limit import RateLimitMiddleware
+from app.services import github_auth
+
+settings = get_settings()
+
+
+async def _ok(scope, receive, send):
+    await PlainTextResponse("ok")(scope, receive, send)
+
+
+@pytest.fixture
+async def redis_client(monkeypatch):
+    """Live Redis from REDIS_URL; the window script needs a real server."""
+    client = aioredis.from_url(settings.REDIS_URL)
+    try:
+        await client.ping()
+    except Exception:
+        await client.aclose()
+        pytest.skip("Redis not available")
+    await client.delete("rate_limit:127.0.0.1")
+    monkeypatch.setattr(github_auth, "redis_client", client)
+    yield client
+    await client.delete("rate_limit:127.0.0.1")
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_rejects_requests_over_the_window(redis_client):
+    """Requests past the limit within one window get 429 and are not recorded."""
+    app = RateLimitMiddleware(_ok, requests_per_minute=3)
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        statuses = [(await client.get("/")).status_code for _ in range(5)]
+
+    assert statuses == [200, 200, 200, 429, 429]
+    assert await redis_client.zcard("rate_limit:127.0.0.1") == 3
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_ignores_forwarded_for(redis_client):
+    """A client cannot get a fresh bucket by sending X-Forwarded-For."""
+    app = RateLimitMiddleware(_ok, requests_per_minute=1)
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        first = await client.get("/", headers={"X-Forwarded-For": "10.0.0.1"})
+        second = await client.get("/", headers={"X-Forwarded-For": "10.0.0.2"})
+
+    assert (first.status_code, second.status_code) == (200, 429)
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_fails_open_without_redis(monkeypatch):
+    """Requests are let through when Redis is not configured."""
+    monkeypatch.setattr(github_auth, "redis_client", None)
+    app = RateLimitMiddleware(_ok, requests_per_minute=1)
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        statuses = [(await client.get("/")).status_code for _ in range(3)]
+
+    assert statuses == [200, 200, 200]
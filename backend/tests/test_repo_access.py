@@ -0,0 +1,34 @@
+"""Tests for repo access helpers."""
+import pytest
+from sqlalchemy.dialects import postgresql
+from app.services.repo_access import MANAGER_ROLES, notify_managers
+
+
+class _RecordingSession:
+    """Stands in for AsyncSession and keeps the executed statements."""
+
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement, *args, **kwargs):
+        self.statements.append(statement)
+
+
+@pytest.mark.asyncio
+async def test_notify_managers_is_one_insert_select():
+    """The fan-out is a single INSERT ... SELECT over the repo's manager roles."""
+    db = _RecordingSession()
+    await notify_managers(db, 5, "pr_validated", {"pr_number": 3})
+
+    assert len(db.statements) == 1
+    compiled = db.statements[0].compile(dialect=postgresql.dialect())
+    sql = " ".join(str(compiled).split())
+    assert sql.startswith("INSERT INTO notifications (user_id, repo_id, kind, payload, read) SELECT user_repo_roles.user_id")
+    assert "FROM user_repo_roles WHERE user_repo_roles.repo_id =" in sql
+    assert "user_repo_roles.role IN" in sql
+
+    params = compiled.params
+    assert 5 in params.values()
+    assert "pr_validated" in params.values()
+    assert {"pr_number": 3} in params.values()
+    assert list(MANAGER_ROLES) in params.values()
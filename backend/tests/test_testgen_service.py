@@ -0,0 +1,26 @@
+"""Tests for test manifest generation helpers."""
+from app.services.testgen_service import _index_checklist_words
+
+
+def test_index_checklist_words_matches_whole_words():
+    """Symbols map to checklist items that mention them as a whole word."""
+    index = _index_checklist_words([
+        ("C1", "User can login with email"),
+        ("C2", "Login-flow shows an error; login is retried"),
+        ("C3", "List all users"),
+    ])
+
+    assert index["login"] == ["C1", "C2"]
+    assert index["email"] == ["C1"]
+    assert index["users"] == ["C3"]
+    # Whole-word matching: "user" does not match "users"
+    assert index["user"] == ["C1"]
+    assert "log" not in index
+
+
+def test_index_checklist_words_is_case_insensitive():
+    """Checklist text is lowercased; callers look up lowercased symbols."""
+    index = _index_checklist_words([("C1", "Validate_Email before saving")])
+
+    assert index["validate_email"] == ["C1"]
+    assert "Validate_Email" not in index